@@ -2,14 +2,10 @@
 #
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import os
-import sys
 import tomllib
 
 from pathlib import Path
 
-sys.path.insert(0, os.path.abspath("../../src"))
-
 project = "MatEnsemble"
 copyright = "2026, Soumendu Bagchi, Kaleb Duchesneau"
 author = "Soumendu Bagchi, Kaleb Duchesneau"
@@ -19,56 +15,35 @@ release = tomllib.loads((_ROOT / "pyproject.toml").read_text(encoding="utf-8"))[
 ]["version"]
 
 extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.autosummary",
+    "autoapi.extension",
     "sphinx.ext.napoleon",
     "sphinx.ext.viewcode",
-    "sphinx_autodoc_typehints",
     "myst_parser",
 ]
 
 templates_path = ["_templates"]
 exclude_patterns = []
 
-autosummary_generate = True
-
-autodoc_default_options = {
-    "members": True,
-    "undoc-members": True,
-    "private-members": False,
-    "special-members": "__init__",
-    "show-inheritance": True,
-    "inherited-members": True,
-    "member-order": "bysource",
-}
-
-autodoc_typehints = "description"
+# sphinx-autoapi parses the sources statically, so building the API reference
+# never imports matensemble or its runtime dependencies (flux, mpi4py, ...).
+autoapi_type = "python"
+autoapi_dirs = [str(_ROOT / "src" / "matensemble")]
+# dynopro and redis were never part of the published API reference
+autoapi_ignore = ["*/dynopro/*", "*/redis/*"]
+autoapi_root = "api"
+autoapi_add_toctree_entry = False
+autoapi_member_order = "bysource"
+autoapi_python_class_content = "both"
+autoapi_options = [
+    "members",
+    "undoc-members",
+    "show-inheritance",
+    "show-module-summary",
+    "imported-members",
+]
 
 napoleon_google_docstring = True
 napoleon_numpy_docstring = True
-
-autodoc_mock_imports = [
-    "flux",
-    "flux.job",
-    "flux.job.executor",
-    "mpi4py",
-    "mpi4py.MPI",
-    "lammps",
-    "numpy",
-    "pandas",
-    "torch",
-    "scipy",
-    "sklearn",
-    "matplotlib",
-    "matplotlib.pyplot",
-    "ase",
-    "pymatgen",
-    "seaborn",
-    "ovito",
-    "ovito.io",
-    "ovito.data",
-    "ovito.pipeline",
-    "redis",
-]
+napoleon_use_ivar = True
 
 html_theme = "sphinx_rtd_theme"
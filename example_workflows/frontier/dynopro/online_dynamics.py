@@ -1,4 +1,3 @@
-import numpy as np
 import json
 import copy
 
@@ -83,7 +82,10 @@ def onlineMD(candidate_parameters, initial_parameters_file=None):
 
 if __name__ == "__main__":
     n_param = 15
-    temperature_data = np.linspace(1500, 3000, n_param)
+    # evenly spaced temperatures from 1500 K to 3000 K (inclusive); a plain
+    # list keeps numpy out of the driver process entirely
+    temperature_step = (3000 - 1500) / (n_param - 1)
+    temperature_data = [1500 + i * temperature_step for i in range(n_param)]
     params_dict = []
 
     import sys
@@ -6,13 +6,16 @@ from mpi4py import MPI
 pipe = Pipeline()
 
 
-@pipe.chore(num_tasks=10, cores_per_task=1, gpus_per_task=0, mpi=true)
+@pipe.chore(num_tasks=10, cores_per_task=1, gpus_per_task=0, mpi=True)
 def mpi_hello_world():
-    size = mpi.comm_world.get_size()
-    rank = mpi.comm_world.get_rank()
-    name = mpi.get_processor_name()
-
-    print(f"hello world! i am process {rank} of {size} on {name}.")
+    comm = MPI.COMM_WORLD
+    size = comm.Get_size()
+    rank = comm.Get_rank()
+    name = MPI.Get_processor_name()
+
+    # Every rank shares the chore's stdout file, so emit one pre-formatted
+    # line per rank instead of creating a file per rank.
+    print(f"hello world! i am process {rank} of {size} on {name}.", flush=True)
 
 
 # Then we add the chore to the workflow 10 separate times
@@ -2,17 +2,29 @@ from __future__ import annotations
 
 import cloudpickle
 import json
+import os
 
-import networkx as nx
 import shlex
 
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Any, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
 from matensemble.model import ChoreType, Resources
 from matensemble.utils import _json_safe
 
+if TYPE_CHECKING:
+    # networkx is only needed to build graphs, and every runtime worker that
+    # unpickles a Chore would otherwise pay for importing it
+    import networkx as nx
+
+
+@lru_cache(maxsize=128)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Tokenize a shell-style command string, memoized across identical commands."""
+    return tuple(shlex.split(command))
+
 
 def registry_entry_filename(key: str) -> str:
     """Return *key* as a basename-only registry filename or raise ValueError."""
@@ -176,6 +188,25 @@ class Chore:
 
     """
 
+    # the manager reads these for every chore it schedules, and a workflow can
+    # hold a great many chores, so they are stored in slots instead of a dict
+    __slots__ = (
+        "id",
+        "command",
+        "chore_type",
+        "resources",
+        "workdir",
+        "spec_path",
+        "chore_qualname",
+        "deps",
+        "args",
+        "kwargs",
+        "dynopro_args",
+        "dynopro_kwargs",
+        "nnodes",
+        "nice",
+    )
+
     def __init__(
         self,
         id: str,
@@ -200,7 +231,9 @@ class Chore:
         id : str
             The ID for the :obj:`Chore`
         command : str, list[str]
-            The command that will be run when the :obj:`Chore` is submitted
+            The command that will be run when the :obj:`Chore` is submitted.
+            Non-string arguments (e.g. numbers or paths) are converted with
+            ``str``.
         chore_type: ChoreType
             Either PYTHON or EXECUTABLE
         resources : Resources
@@ -236,12 +269,16 @@ class Chore:
 
         self.id = id
         self.command = (
-            shlex.split(command) if isinstance(command, str) else list(command)
+            list(_split_command(command))
+            if isinstance(command, str)
+            else list(map(str, command))
         )
 
         self.chore_type = chore_type
         self.resources = resources
-        self.workdir = workdir.resolve()
+        # abspath is pure string manipulation; resolve() would lstat every
+        # path component, which adds up per chore on network filesystems
+        self.workdir = Path(os.path.abspath(workdir))
         self.spec_path = self.workdir / "chore.pickle"
 
         self.chore_qualname = chore_qualname
@@ -256,6 +293,8 @@ class Chore:
         self.nice = nice
 
     def graph(self) -> nx.DiGraph:
+        import networkx as nx
+
         return nx.DiGraph()
 
     def _to_debug_dict(self) -> dict:
@@ -34,6 +34,15 @@ def _downsample(records: list[dict[str, Any]], limit: int) -> list[dict[str, Any
     return [records[index] for index in sorted(indexes)]
 
 
+def _failure_stderr(status: dict[str, Any] | None, chore_id: str) -> str:
+    # failures record where the chore's stderr went (the shared file when the
+    # workflow used shared output); older status files only have the default
+    for failure in (status or {}).get("failures") or ():
+        if failure.get("chore_id") == chore_id and failure.get("stderr"):
+            return failure["stderr"]
+    return f"out/{chore_id}/stderr"
+
+
 def read_history(
     workflow_path: Path,
     status: dict[str, Any],
@@ -242,14 +251,14 @@ def create_dashboard_app(
         chore_id = request.path_params["chore_id"]
         if not CHORE_ID_RE.fullmatch(chore_id) or chore_id in {".", ".."}:
             return _error("invalid_chore_id", "The chore ID is invalid.", 400)
-        record = catalog.get(identifier)
+        record = await asyncio.to_thread(catalog.status, identifier)
         if record is None or record.health == "missing":
             return _error(
                 "workflow_not_found",
                 "The workflow is no longer available.",
                 404,
             )
-        stderr_path = record.path / "out" / chore_id / "stderr"
+        stderr_path = record.path / _failure_stderr(record.status, chore_id)
         try:
             resolved = stderr_path.resolve()
             resolved.relative_to(record.path.resolve())
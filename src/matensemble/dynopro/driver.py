@@ -16,8 +16,7 @@ __package__ = "matensemble"
 
 def _load_dep_result(chore_dir: Path, dep_id: str) -> Any:
     dep_result = chore_dir.parent / dep_id / "result.pickle"
-    with dep_result.open("rb") as f:
-        return pickle.load(f)
+    return pickle.loads(dep_result.read_bytes())
 
 
 def _callable_accepts_kwargs(func: Any) -> bool:
@@ -55,10 +54,8 @@ def _run_chore(
 ) -> Any:
     chore_dir = Path(chore_dir).resolve()
     registry = chore_dir.parent / "registry"
-    with (registry / chore_name).open("rb") as f:
-        func = cloudpickle.load(f)
-    with (chore_dir / "chore.pickle").open("rb") as f:
-        metadata = pickle.load(f)
+    func = cloudpickle.loads((registry / chore_name).read_bytes())
+    metadata = pickle.loads((chore_dir / "chore.pickle").read_bytes())
 
     dep_results = {dep: _load_dep_result(chore_dir, dep) for dep in metadata.deps}
     dynopro_args = getattr(metadata, "dynopro_args", {})
@@ -65,18 +65,18 @@ class EnsembleDynamicsRunner:
                 "Dynopro Error: the length of the simulation list and simulation argument list are not equal."
             )
         else:
-            for i in range(length):
-                popped = self.sim_list.pop(0)
-                chore_id = f"chore-dynopro-{popped}-{i:04d}"
-                resources = Resources(
-                    num_tasks=self.tasks_per_job,
-                    cores_per_task=self.cores_per_task,
-                    gpus_per_task=self.gpus_per_task,
-                    mpi=True,
-                )
+            # every simulation has the same per-job shape, so one validated
+            # Resources instance is shared by all of the chores
+            resources = Resources(
+                num_tasks=self.tasks_per_job,
+                cores_per_task=self.cores_per_task,
+                gpus_per_task=self.gpus_per_task,
+                mpi=True,
+            )
+            for i, (sim, args) in enumerate(zip(self.sim_list, self.sim_args_list)):
+                chore_id = f"chore-dynopro-{sim}-{i:04d}"
                 workdir = outdir / chore_id
 
-                args = self.sim_args_list.pop(0)
                 command = f"{self.sim_command} '{args}'"
                 chores.append(
                     Chore(
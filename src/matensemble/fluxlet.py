@@ -1,14 +1,27 @@
+from __future__ import annotations
+
+import contextlib
 import os
 import pickle
 import json
+import queue
 import tempfile
+import threading
 
-import flux
-import flux.job
-
+from collections import deque
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
 from matensemble.chore import Chore
 from matensemble.model import ChoreType
+from matensemble.utils import _write_all
+
+if TYPE_CHECKING:
+    import flux
+    import flux.job
+
+DEFAULT_SUBMIT_FANOUT = 64
+
+_WORKDIR_PLACEHOLDER = "@MATENSEMBLE_WORKDIR@"
 
 
 class Fluxlet:
@@ -19,14 +32,52 @@ class Fluxlet:
     ----------
     handle : flux.Flux
         A flux handle to be used to submit chores
+    fanout : int
+        The maximum number of submissions that may be waiting on the job-ingest
+        module at once before :meth:`submit` waits for the oldest to be
+        assigned a jobid
+    shared_stdout_path : str or None
+        When set, every chore appends its stdout to this one file instead of
+        creating ``<workdir>/stdout``. Lines are labeled only with their task
+        rank, so they cannot be traced back to the chore that wrote them
+    shared_stderr_path : str or None
+        When set, every chore appends its stderr to this one file instead of
+        creating ``<workdir>/stderr``, with the same rank-only labels
     """
 
     def __init__(
         self,
         handle: flux.Flux,
+        fanout: int = DEFAULT_SUBMIT_FANOUT,
+        allocation: tuple[int, int] | None = None,
+        shared_stdout_path: str | os.PathLike | None = None,
+        shared_stderr_path: str | os.PathLike | None = None,
     ) -> None:
+        if fanout < 1:
+            raise ValueError("fanout must be >= 1")
+
         self.handle = handle
-        self.num_nodes, self.gpus_per_node = self.get_gpus_per_node()
+        self.fanout = fanout
+        self.shared_stdout_path = (
+            None if shared_stdout_path is None else os.fspath(shared_stdout_path)
+        )
+        self.shared_stderr_path = (
+            None if shared_stderr_path is None else os.fspath(shared_stderr_path)
+        )
+        self._ingesting: deque[flux.job.FluxExecutorFuture] = deque()
+        # The environment is snapshotted once and shared by every jobspec that
+        # does not override it, instead of copying os.environ per submission
+        self._env_snapshot = os.environ.copy()
+        self._created_workdirs: set[str] = set()
+        self._jobspec_templates: dict[tuple, str] = {}
+        # debug metadata is written by a background thread, started on first use
+        self._metadata_queue: queue.SimpleQueue[Chore | None] = queue.SimpleQueue()
+        self._metadata_thread: threading.Thread | None = None
+        # ``allocation`` is the already measured ``(num_nodes, gpus_per_node)``;
+        # without it the allocation is drained and queried here
+        if allocation is None:
+            allocation = self.get_gpus_per_node()
+        self.num_nodes, self.gpus_per_node = allocation
 
     def get_gpus_per_node(self) -> tuple[int, int]:
         """
@@ -34,6 +85,8 @@ class Fluxlet:
         GPUs per node.
         """
 
+        import flux.resource
+
         # drain broker rank first, then measure what is actually usable
         self.handle.rpc("resource.drain", {"targets": "0"}).get()
 
@@ -47,16 +100,291 @@ class Fluxlet:
         gpus_per_node = total_gpus // nnodes
         return nnodes, gpus_per_node
 
+    def prepare_workdirs(self, chores: Iterable[Chore]) -> None:
+        """
+        Creates the working directories of many :obj:`Chore`'s in a single
+        pass so that submitting them later does not need to touch the
+        filesystem to create their directories.
+
+        Parameters
+        ----------
+        chores : Iterable[Chore]
+            The :obj:`Chore`'s whose working directories should be created.
+        """
+
+        created = self._created_workdirs
+        scanned: set[str] = set()
+        for chore in chores:
+            workdir = str(chore.workdir)
+            if workdir in created:
+                continue
+
+            # chores share a handful of parent directories, so one scandir per
+            # parent finds every directory that already exists without a stat
+            # or mkdir per chore
+            parent = os.path.dirname(workdir)
+            if parent not in scanned:
+                scanned.add(parent)
+                try:
+                    with os.scandir(parent) as entries:
+                        created.update(
+                            entry.path for entry in entries if entry.is_dir()
+                        )
+                except FileNotFoundError:
+                    pass
+                if workdir in created:
+                    continue
+
+            os.makedirs(workdir, exist_ok=True)
+            created.add(workdir)
+
+    def _ensure_workdir(self, chore: Chore) -> None:
+        workdir = str(chore.workdir)
+        if workdir not in self._created_workdirs:
+            os.makedirs(workdir, exist_ok=True)
+            self._created_workdirs.add(workdir)
+
     def _write_chore_spec_if_needed(self, chore: Chore) -> None:
         if chore.chore_type is not ChoreType.PYTHON and chore.nnodes is None:
             return
 
-        with tempfile.NamedTemporaryFile(
-            "wb", dir=chore.spec_path.parent, delete=False
-        ) as tf:
-            pickle.dump(chore, tf)
-            temp_name = tf.name
-        os.replace(temp_name, chore.spec_path)
+        # pickling to bytes first hands the spec to the filesystem in one
+        # write() instead of the many small ones pickle.dump makes
+        payload = pickle.dumps(chore, protocol=pickle.HIGHEST_PROTOCOL)
+        fd, temp_name = tempfile.mkstemp(dir=chore.spec_path.parent)
+        try:
+            try:
+                _write_all(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(temp_name, chore.spec_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
+
+    def _jobspec_from_template(
+        self,
+        chore: Chore,
+        per_node: bool,
+        set_cpu_affinity: bool,
+        set_gpu_affinity: bool,
+    ) -> flux.job.JobspecV1:
+        """
+        Returns a fresh :obj:`Jobspec` for the chore's resource shape.
+
+        The resource, shell-option and output sections are identical for every
+        chore with the same shape, so they are built and serialized once. Each
+        chore gets a clone with its working directory substituted into the
+        serialized template and its command swapped in.
+        """
+
+        import flux.job
+
+        resources = chore.resources
+        key = (
+            per_node,
+            chore.nnodes,
+            resources.num_tasks,
+            resources.cores_per_task,
+            resources.gpus_per_task,
+            resources.mpi,
+            set_cpu_affinity,
+            set_gpu_affinity,
+        )
+
+        template_json = self._jobspec_templates.get(key)
+        if template_json is None:
+            # Dynopro splits jobs between the CPUs and GPUs. GPUs are used for
+            # the intensive jobs and then processing jobs are spawned into the CPUs
+            if per_node:
+                template = flux.job.JobspecV1.per_resource(
+                    chore.command,
+                    ncores=resources.num_tasks,
+                    nnodes=chore.nnodes,
+                    gpus_per_node=self.gpus_per_node,
+                    per_resource_type="core",
+                    per_resource_count=1,
+                    exclusive=True,
+                )
+            else:
+                template = flux.job.JobspecV1.from_command(
+                    chore.command,
+                    resources.num_tasks,
+                    resources.cores_per_task,
+                    resources.gpus_per_task,
+                )
+
+            if resources.mpi:
+                template.setattr_shell_option("mpi", "pmi2")
+            if set_cpu_affinity:
+                template.setattr_shell_option("cpu-affinity", "per-task")
+            if set_gpu_affinity:
+                template.setattr_shell_option("gpu-affinity", "per-task")
+            if self.shared_stdout_path or self.shared_stderr_path:
+                # many jobs share the output files, so they must append rather
+                # than truncate. The shell can only label lines with the task
+                # rank, so which chore wrote a shared line is not recorded
+                template.setattr_shell_option("output.mode", "append")
+            if self.shared_stdout_path:
+                template.setattr_shell_option("output.stdout.label", True)
+            if self.shared_stderr_path:
+                template.setattr_shell_option("output.stderr.label", True)
+
+            # the working directory is the only per-chore value in the paths,
+            # so it is left as a placeholder that is patched into the JSON
+            template.cwd = _WORKDIR_PLACEHOLDER
+            template.stdout = self.shared_stdout_path or (
+                _WORKDIR_PLACEHOLDER + "/stdout"
+            )
+            template.stderr = self.shared_stderr_path or (
+                _WORKDIR_PLACEHOLDER + "/stderr"
+            )
+
+            template_json = template.dumps()
+            self._jobspec_templates[key] = template_json
+
+        # json.dumps escapes the path exactly as it must appear inside the
+        # serialized template; [1:-1] drops the surrounding quotes
+        workdir_json = json.dumps(str(chore.workdir))[1:-1]
+        jobspec = flux.job.JobspecV1(
+            **json.loads(template_json.replace(_WORKDIR_PLACEHOLDER, workdir_json))
+        )
+        jobspec.tasks[0]["command"] = list(chore.command)
+        return jobspec
+
+    def _build_jobspec(
+        self,
+        chore: Chore,
+        set_cpu_affinity: bool | None = None,
+        set_gpu_affinity: bool | None = None,
+        dynopro: bool | None = None,
+    ) -> flux.job.JobspecV1:
+        """
+        Builds the :obj:`Jobspec` for a :obj:`Chore` and prepares its working
+        directory so that it is ready to be handed to the executor.
+
+        Parameters
+        ----------
+        chore : Chore
+            The :obj:`Chore` to build a :obj:`Jobspec` for.
+        set_cpu_affinity : bool, optional
+            Whether cpu-affinity should be set in the :obj:`Jobspec`. Defaults
+            to None.
+        set_gpu_affinity : bool, optional
+            Whether gpu-affinity should be set in the :obj:`Jobspec`. Defaults
+            to None.
+        dynopro : bool, optional
+            Whether the chore is a dynopro chore that is split between the CPUs
+            and GPUs of its nodes. Defaults to None.
+
+        Returns
+        -------
+        flux.job.JobspecV1
+        """
+
+        per_node = bool(dynopro or chore.nnodes)
+        jobspec = self._jobspec_from_template(
+            chore,
+            per_node,
+            set_cpu_affinity=bool(set_cpu_affinity),
+            set_gpu_affinity=bool(
+                set_gpu_affinity and chore.resources.gpus_per_task > 0
+            ),
+        )
+
+        self._ensure_workdir(chore)
+        self._write_chore_spec_if_needed(chore)
+
+        jobspec.environment = self._chore_env(chore, per_node)
+
+        if not per_node:
+            # helpful for debugging
+            self._queue_metadata(chore)
+
+        return jobspec
+
+    def _queue_metadata(self, chore: Chore) -> None:
+        """
+        Hands a chore's debug ``metadata.json`` to the background writer so the
+        submission loop does not wait on the filesystem for it.
+        """
+
+        if self._metadata_thread is None:
+            self._metadata_thread = threading.Thread(
+                target=self._metadata_worker,
+                name="matensemble-metadata",
+                daemon=True,
+            )
+            self._metadata_thread.start()
+        self._metadata_queue.put(chore)
+
+    def _metadata_worker(self) -> None:
+        while True:
+            chore = self._metadata_queue.get()
+            if chore is None:
+                return
+            try:
+                chore._write_metadata()
+            except Exception:
+                # the metadata is only a debugging aid and never fails a chore
+                pass
+
+    def flush_metadata(self) -> None:
+        """
+        Waits until every queued ``metadata.json`` has been written and stops
+        the background writer. A later submission starts a new one.
+        """
+
+        thread = self._metadata_thread
+        if thread is None:
+            return
+        self._metadata_queue.put(None)
+        thread.join()
+        self._metadata_thread = None
+
+    def _chore_env(self, chore: Chore, per_node: bool) -> dict[str, str]:
+        """
+        Returns the environment for a chore. The shared snapshot is returned
+        as-is when nothing needs to be overridden and is otherwise copied, so
+        the snapshot itself is never mutated.
+        """
+
+        overrides = dict(chore.resources.env or {})
+        if per_node:
+            overrides["SLURM_GPUS_PER_NODE"] = str(self.gpus_per_node)
+
+        if not chore.resources.inherit_env:
+            return overrides
+        if not overrides:
+            return self._env_snapshot
+        return {**self._env_snapshot, **overrides}
+
+    def _annotate(
+        self, fut: flux.job.FluxExecutorFuture, chore: Chore
+    ) -> flux.job.FluxExecutorFuture:
+        # only what the strategies read back is attached to the future
+        fut.chore_id = chore.id
+        fut.chore_obj = chore
+        self._throttle(fut)
+        return fut
+
+    def _throttle(self, fut: flux.job.FluxExecutorFuture) -> None:
+        """
+        Keeps at most :attr:`fanout` submissions in flight to the job-ingest
+        module. The executor submits asynchronously, so once the window is
+        full this waits for the oldest submission to receive its jobid.
+        """
+
+        ingesting = self._ingesting
+        ingesting.append(fut)
+        while len(ingesting) > self.fanout:
+            oldest = ingesting.popleft()
+            try:
+                oldest.jobid()
+            except Exception:
+                # a rejected submission is reported through the future itself
+                pass
 
     def submit(
         self,
@@ -82,86 +410,84 @@ class Fluxlet:
         set_gpu_affinity : bool, optional
             Whether gpu-affinity should be set in the :obj:`Jobspec`. Defaults
             to None.
-        nnodes : int, optional
-            The number of nodes that the given chore needs to be able to run. Defaults
-            to None.
+        dynopro : bool, optional
+            Whether the chore is a dynopro chore that is split between the CPUs
+            and GPUs of its nodes. Defaults to None.
 
         Returns
         -------
         flux.job.FluxExecutorFuture
         """
 
-        # Dynopro splits jobs between the CPUs and GPUs. GPUs are used for
-        # the intensive jobs and then processing jobs are spawned into the CPUs
-        if dynopro or chore.nnodes:
-            jobspec = flux.job.JobspecV1.per_resource(
-                chore.command,
-                ncores=chore.resources.num_tasks,
-                nnodes=chore.nnodes,
-                gpus_per_node=self.gpus_per_node,
-                per_resource_type="core",
-                per_resource_count=1,
-                exclusive=True,
-            )
+        jobspec = self.prepare(
+            chore,
+            set_cpu_affinity=set_cpu_affinity,
+            set_gpu_affinity=set_gpu_affinity,
+            dynopro=dynopro,
+        )
+        return self.submit_prepared(executor, chore, jobspec)
 
-            chore.workdir.mkdir(parents=True, exist_ok=True)
-            self._write_chore_spec_if_needed(chore)
-
-            jobspec.cwd = str(chore.workdir)
-            jobspec.stdout = str(chore.workdir / "stdout")
-            jobspec.stderr = str(chore.workdir / "stderr")
+    def prepare(
+        self,
+        chore: Chore,
+        set_cpu_affinity: bool | None = None,
+        set_gpu_affinity: bool | None = None,
+        dynopro: bool | None = None,
+    ) -> flux.job.JobspecV1:
+        """
+        Does all of the local work for submitting a :obj:`Chore`: builds its
+        :obj:`Jobspec` and prepares its working directory. Splitting this from
+        :meth:`submit_prepared` lets callers prepare a whole batch and then
+        hand every submission to the executor back-to-back.
 
-            if chore.resources.mpi:
-                jobspec.setattr_shell_option("mpi", "pmi2")
-            if set_cpu_affinity:
-                jobspec.setattr_shell_option("cpu-affinity", "per-task")
-            if set_gpu_affinity and chore.resources.gpus_per_task > 0:
-                jobspec.setattr_shell_option("gpu-affinity", "per-task")
-
-            base_env = os.environ.copy() if chore.resources.inherit_env else {}
-            base_env.update(chore.resources.env or {})
-            base_env["SLURM_GPUS_PER_NODE"] = str(self.gpus_per_node)
-            jobspec.environment = base_env
-
-            fut = executor.submit(jobspec)
-            fut.chore_id = chore.id
-            fut.chore_obj = chore
-            fut.chore_spec = jobspec
-            fut.workdir = str(chore.workdir)
-            return fut
-        else:
-            jobspec = flux.job.JobspecV1.from_command(
-                chore.command,
-                chore.resources.num_tasks,
-                chore.resources.cores_per_task,
-                chore.resources.gpus_per_task,
-            )
+        Parameters
+        ----------
+        chore : Chore
+            The :obj:`Chore` to prepare.
+        set_cpu_affinity : bool, optional
+            Whether cpu-affinity should be set in the :obj:`Jobspec`. Defaults
+            to None.
+        set_gpu_affinity : bool, optional
+            Whether gpu-affinity should be set in the :obj:`Jobspec`. Defaults
+            to None.
+        dynopro : bool, optional
+            Whether the chore is a dynopro chore that is split between the CPUs
+            and GPUs of its nodes. Defaults to None.
 
-            chore.workdir.mkdir(parents=True, exist_ok=True)
+        Returns
+        -------
+        flux.job.JobspecV1
+        """
 
-            self._write_chore_spec_if_needed(chore)
+        return self._build_jobspec(
+            chore,
+            set_cpu_affinity=set_cpu_affinity,
+            set_gpu_affinity=set_gpu_affinity,
+            dynopro=dynopro,
+        )
 
-            jobspec.cwd = str(chore.workdir)
-            jobspec.stdout = str(chore.workdir / "stdout")
-            jobspec.stderr = str(chore.workdir / "stderr")
+    def submit_prepared(
+        self,
+        executor: flux.job.FluxExecutor,
+        chore: Chore,
+        jobspec: flux.job.JobspecV1,
+    ) -> flux.job.FluxExecutorFuture:
+        """
+        Submits a :obj:`Jobspec` returned by :meth:`prepare` and annotates the
+        future with its :obj:`Chore`.
 
-            if chore.resources.mpi:
-                jobspec.setattr_shell_option("mpi", "pmi2")
-            if set_cpu_affinity:
-                jobspec.setattr_shell_option("cpu-affinity", "per-task")
-            if set_gpu_affinity and chore.resources.gpus_per_task > 0:
-                jobspec.setattr_shell_option("gpu-affinity", "per-task")
+        Parameters
+        ----------
+        executor : flux.job.FluxExecutor
+            The :obj:`FluxExecutor` to use to submit the flux job
+        chore : Chore
+            The :obj:`Chore` the :obj:`Jobspec` was prepared for.
+        jobspec : flux.job.JobspecV1
+            The prepared :obj:`Jobspec`.
 
-            base_env = os.environ.copy() if chore.resources.inherit_env else {}
-            base_env.update(chore.resources.env or {})
-            jobspec.environment = base_env
+        Returns
+        -------
+        flux.job.FluxExecutorFuture
+        """
 
-            # helpful for debugging
-            chore._write_metadata()
-
-            fut = executor.submit(jobspec)
-            fut.chore_id = chore.id
-            fut.chore_obj = chore
-            fut.chore_spec = jobspec
-            fut.workdir = str(chore.workdir)
-            return fut
+        return self._annotate(executor.submit(jobspec), chore)
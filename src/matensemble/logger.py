@@ -1,14 +1,21 @@
+import atexit
+import contextlib
 import logging
+import logging.handlers
 import json
+import queue
 import sys
 import os
 import tempfile
 import threading
+import time
 import uuid
 
 from datetime import datetime, timezone
 from pathlib import Path
 
+from matensemble.utils import _write_all
+
 
 SCHEMA_VERSION = 2
 TERMINAL_STATES = {"completed", "failed", "interrupted"}
@@ -170,6 +177,16 @@ class StatusWriter:
         self.campaign = campaign if campaign is not None else path.parent.parent.name
         self.started_at = utc_now()
         self.sequence = -1
+        # these parts of the summary never change, so build them once instead
+        # of on every progress tick
+        self._started_at_text = format_utc(self.started_at)
+        self._allocation = {
+            "nodes": nnodes,
+            "cores_per_node": cores_per_node,
+            "gpus_per_node": gpus_per_node,
+            "total_cores": nnodes * cores_per_node,
+            "total_gpus": nnodes * gpus_per_node,
+        }
         self.current = {
             "sequence": -1,
             "pending": 0,
@@ -182,6 +199,8 @@ class StatusWriter:
             "free_gpus": nnodes * gpus_per_node,
         }
         self.failures: list[dict] = []
+        # the caller's failures list that self.failures was converted from
+        self._failures_source: list[dict] | None = None
         self._failure_timestamps: dict[str, str] = {}
         self._lock = threading.Lock()
         self.path.parent.mkdir(parents=True, exist_ok=True)
@@ -229,9 +248,21 @@ class StatusWriter:
                 "free_gpus": free_gpus,
             }
             if failures is not None:
-                self.failures = [
-                    self._failure_for_dashboard(item, now) for item in failures
-                ]
+                known = len(self.failures)
+                if failures is self._failures_source and len(failures) >= known:
+                    # the same list as last time, which the manager only ever
+                    # appends to, so just the new failures need converting
+                    self.failures.extend(
+                        self._failure_for_dashboard(item, now)
+                        for item in failures[known:]
+                    )
+                else:
+                    # a different (or shrunk) list may share nothing with the
+                    # converted one, so it is converted from scratch
+                    self.failures = [
+                        self._failure_for_dashboard(item, now) for item in failures
+                    ]
+                    self._failures_source = failures
 
             record = {
                 "sequence": self.sequence,
@@ -240,10 +271,17 @@ class StatusWriter:
                 "state": state,
                 **{key: self.current[key] for key in self.current if key != "sequence"},
             }
-            with self.history_path.open("a", encoding="utf-8") as history:
-                history.write(json.dumps(record, separators=(",", ":")) + "\n")
-                history.flush()
-                os.fsync(history.fileno())
+            # one unbuffered append per snapshot: no TextIOWrapper to set up and
+            # no separate flush before the fsync
+            line = json.dumps(record, separators=(",", ":")) + "\n"
+            fd = os.open(
+                self.history_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+            try:
+                _write_all(fd, line.encode("utf-8"))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
             self._write_summary(state=state, now=now)
 
@@ -261,10 +299,14 @@ class StatusWriter:
             "reason": failure.get("reason"),
             "upstream": failure.get("upstream"),
             "message": failure.get("message") or failure.get("exception"),
-            "stderr": f"out/{chore_id}/stderr" if chore_id else None,
+            # the manager records where the chore's stderr went; failures
+            # without one are assumed to use the per-chore default
+            "stderr": failure.get("stderr")
+            or (f"out/{chore_id}/stderr" if chore_id else None),
         }
 
     def _write_summary(self, *, state: str, now: datetime) -> None:
+        now_text = format_utc(now)
         data = {
             "schema_version": SCHEMA_VERSION,
             "workflow": {
@@ -272,32 +314,36 @@ class StatusWriter:
                 "name": self.workflow_name,
                 "campaign": self.campaign,
                 "state": state,
-                "started_at": format_utc(self.started_at),
-                "updated_at": format_utc(now),
-                "finished_at": format_utc(now) if state in TERMINAL_STATES else None,
+                "started_at": self._started_at_text,
+                "updated_at": now_text,
+                "finished_at": now_text if state in TERMINAL_STATES else None,
                 "elapsed_seconds": self._elapsed(now),
             },
-            "allocation": {
-                "nodes": self.nnodes,
-                "cores_per_node": self.cores_per_node,
-                "gpus_per_node": self.gpus_per_node,
-                "total_cores": self.nnodes * self.cores_per_node,
-                "total_gpus": self.nnodes * self.gpus_per_node,
-            },
+            "allocation": self._allocation,
             "current": self.current,
             "failures": self.failures,
             "history_file": self.history_path.name,
         }
 
-        with tempfile.NamedTemporaryFile(
-            "w", encoding="utf-8", dir=self.path.parent, delete=False
-        ) as tf:
-            json.dump(data, tf, indent=2)
-            tf.flush()
-            os.fsync(tf.fileno())
-            temp_name = tf.name
-
-        os.replace(temp_name, self.path)
+        # json.dump streams many small chunks into the file; encoding up front
+        # hands the whole document to unbuffered write()s
+        payload = json.dumps(data, indent=2).encode("utf-8")
+        fd, temp_name = tempfile.mkstemp(dir=self.path.parent)
+        try:
+            try:
+                # mkstemp creates the file 0o600; keep status.json readable by
+                # a dashboard running as another user, as before
+                os.fchmod(fd, 0o644)
+                _write_all(fd, payload)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(temp_name, self.path)
+        except BaseException:
+            # never leave a half-written temp file next to status.json
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
 
 
 def _setup_status_writer(
@@ -327,29 +373,183 @@ def _setup_status_writer(
     )
 
 
+_LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%SZ"
+_LOG_BUFFER_CAPACITY = 512
+
+
+class _WorkflowFormatter(logging.Formatter):
+    """
+    Formatter for the workflow log
+
+    Produces the same lines as a plain :obj:`logging.Formatter` with
+    ``_LOG_FORMAT`` but joins the fields with a single f-string instead of
+    interpolating the whole format string through the record's ``__dict__``.
+    Times are in UTC, like the timestamps in status.json and
+    status_history.jsonl. ``_LOG_DATEFMT`` has one second resolution, so the
+    time text is only formatted once per second and reused for every record
+    logged within it.
+    """
+
+    converter = time.gmtime
+
+    def __init__(self) -> None:
+        super().__init__(fmt=_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+        # (second, text) is swapped as one tuple so concurrent handlers never
+        # see a second paired with another second's text
+        self._time_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt != _LOG_DATEFMT:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] != second:
+            cached = (second, time.strftime(datefmt, self.converter(second)))
+            self._time_cache = cached
+        return cached[1]
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        line = (
+            f"{self.formatTime(record, self.datefmt)} | {record.levelname} | "
+            f"{record.name} | {record.message}"
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if not line.endswith("\n"):
+                line += "\n"
+            line += record.exc_text
+        if record.stack_info:
+            if not line.endswith("\n"):
+                line += "\n"
+            line += self.formatStack(record.stack_info)
+        return line
+
+
+_log_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    """
+    Write out every queued log record and stop the background logging thread
+    """
+
+    global _log_listener
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+
+
+def _flush_log_buffer() -> None:
+    """
+    Write the records buffered so far by the listener's handlers to the log file
+    """
+
+    if _log_listener is not None:
+        for handler in _log_listener.handlers:
+            handler.flush()
+
+
+def _flush_log_listener() -> None:
+    """
+    Block until every log record queued so far has been written to the log file
+    """
+
+    if _log_listener is not None:
+        # stop() drains the queue before joining the thread; start() brings up a
+        # fresh thread so logging keeps working afterwards
+        _log_listener.stop()
+        _log_listener.start()
+        _flush_log_buffer()
+
+
+atexit.register(_stop_log_listener)
+
+
+def _active_log_file() -> str | None:
+    """
+    Return the path of the file the running log listener writes to, if any
+    """
+
+    if _log_listener is None:
+        return None
+    for handler in _log_listener.handlers:
+        target = getattr(handler, "target", None)
+        if isinstance(target, logging.FileHandler):
+            return target.baseFilename
+    return None
+
+
+def _print_log_hint(base_dir: Path) -> None:
+    hint = (
+        f"Logs: {base_dir}/matensemble_workflow.log\n"
+        f"Outputs: {base_dir}/out\n\n"
+        f"Watch logs: watch tail -n 5 {base_dir}/matensemble_workflow.log"
+    )
+    print(hint, file=sys.stderr)
+
+
 def _setup_logger(base_dir: Path) -> logging.Logger:
     """
     setup the status writer for the :obj:`FluxManager`
+
+    Records for the log file are handed to a :obj:`QueueListener` thread so that
+    logging from the manager loop never blocks on disk I/O. That thread buffers
+    them in a :obj:`MemoryHandler` which writes to the file once it holds
+    ``_LOG_BUFFER_CAPACITY`` records, on any WARNING or worse, and whenever the
+    manager flushes it. The optional console handler stays synchronous.
+
+    Calling this again for the same ``base_dir`` reuses the running listener
+    and its open file instead of tearing them down and opening the file again.
     """
 
     logger = logging.getLogger("matensemble")
     logger.setLevel(logging.DEBUG)
     logger.propagate = False
 
+    log_file = base_dir / "matensemble_workflow.log"
+    if logger.handlers and _active_log_file() == os.path.abspath(log_file):
+        # Already writing to this file; keep the listener and its open handler
+        _print_log_hint(base_dir)
+        logger.info("Workflow initialized at %s", base_dir)
+        return logger
+
     # Prevent duplicate handlers if setup is called twice
     if logger.handlers:
         logger.handlers.clear()
+    _stop_log_listener()
 
-    fmt = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    fmt = _WorkflowFormatter()
 
-    log_file = base_dir / f"matensemble_workflow.log"
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(fmt)
-    logger.addHandler(file_handler)
+
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=_LOG_BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    memory_handler.setLevel(logging.DEBUG)
+
+    global _log_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     if sys.stderr.isatty():
         console_handler = logging.StreamHandler(stream=sys.stderr)
@@ -357,12 +557,7 @@ def _setup_logger(base_dir: Path) -> logging.Logger:
         console_handler.setFormatter(fmt)
         logger.addHandler(console_handler)
 
-    hint = (
-        f"Logs: {base_dir}/matensemble_workflow.log\n"
-        f"Outputs: {base_dir}/out\n\n"
-        f"Watch logs: watch tail -n 5 {base_dir}/matensemble_workflow.log"
-    )
-    print(hint, file=sys.stderr)
+    _print_log_hint(base_dir)
 
-    logger.info(f"Workflow initialized at {base_dir}")
+    logger.info("Workflow initialized at %s", base_dir)
     return logger
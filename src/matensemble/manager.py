@@ -1,20 +1,56 @@
+import os
 import time
+import contextlib
+import queue
+import bisect
+import itertools
+import logging
 import threading
 
-import flux
-import flux.job
-
 from pathlib import Path
 from collections import deque
 
-from matensemble.logger import _setup_logger, _setup_status_writer
+from matensemble.logger import (
+    _flush_log_buffer,
+    _flush_log_listener,
+    _setup_logger,
+    _setup_status_writer,
+)
 from matensemble.chore import Chore
 from matensemble.strategy import (
     AdaptiveStrategy,
     NonAdaptiveStrategy,
     FutureProcessingStrategy,
 )
-from matensemble.fluxlet import Fluxlet
+from matensemble.fluxlet import DEFAULT_SUBMIT_FANOUT, Fluxlet
+
+# unchanged progress ticks still refresh the status file this often (seconds),
+# well inside the dashboard's default 30 second staleness window
+_PROGRESS_HEARTBEAT = 10.0
+
+# flux handles keyed by (pid, thread, uri) so that managers created one after
+# another on a thread share one broker connection. A flux.Flux handle is not
+# thread-safe, so pipelines running on different threads get their own, and a
+# forked child opens its own as well
+_flux_handle_cache = {}
+_flux_handle_lock = threading.Lock()
+
+
+def _get_flux_handle(uri: str | None = None):
+    """
+    Returns the calling thread's handle to the Flux instance at ``uri`` (the
+    enclosing instance when None), connecting on first use
+    """
+
+    key = (os.getpid(), threading.get_ident(), uri)
+    with _flux_handle_lock:
+        handle = _flux_handle_cache.get(key)
+        if handle is None:
+            import flux
+
+            handle = flux.Flux() if uri is None else flux.Flux(uri)
+            _flux_handle_cache[key] = handle
+    return handle
 
 
 class FluxManager:
@@ -29,21 +65,32 @@ class FluxManager:
     _chores_by_id : dict
         A dictionary of chore_id's to :obj:`Chore`
     _dependents : dict
-        A dictionary of chore_id's to a list of chore_id's that they depend on
+        A dictionary of chore_id's to a list of the chore_id's that depend on
+        them. Chores that nothing depends on have no entry.
     _remaining_deps : dict
         A dictionary of chore_id's to integers (the number of dependencies remaining)
     _ready : collections.deque
         A double ended queue of :obj:`Chore`'s that are ready for submission
     _blocked : set
         A set of :obj:`Chore`'s that are waiting on their dependencies to resolve
-    _running_chores : set
-        A set of :obj:`Chore`'s that are currently running
-    _completed_chores : list
-        A list of :obj:`Chore`'s that have completed successfully
+    _running_chores : dict
+        A dictionary of the chore_id's that are currently running to the future
+        objects representing their completion
+    _completed_chores : set
+        A set of the chore_id's that have completed successfully
     _failed_chores : list
         A list of :obj:`Chore`'s that failed
-    _futures : set
-        A set of future objects representing the completion of running chores
+    _failed_ids : set
+        The chore_id's in ``_failed_chores``, for constant time lookups
+    _completed_futures : queue.SimpleQueue
+        Futures pushed by their done callbacks as the chores finish, drained by
+        :meth:`_collect_completed`
+    _flux_uri : str or None
+        The URI of the Flux instance the chores run in, None for the enclosing
+        instance
+    _manager_cpus : set or None
+        The CPUs :meth:`run` pins the calling thread and the threads it starts
+        to for the duration of the run, None to leave the affinity alone
     _flux_handle : flux.Flux
         A flux handle
     _fluxlet : matensemble.Fluxlet
@@ -74,6 +121,11 @@ class FluxManager:
         set_cpu_affinity: bool = True,
         set_gpu_affinity: bool = True,
         restart_file: str | None = None,
+        shared_output: bool = False,
+        max_in_flight: int | None = None,
+        flux_uri: str | None = None,
+        submit_fanout: int = DEFAULT_SUBMIT_FANOUT,
+        manager_cpus: set[int] | None = None,
     ) -> None:
         """
         Parameters
@@ -91,6 +143,31 @@ class FluxManager:
         restart_file : str
             The path to a restart file which will be loaded and restart the work-
             flow from the save point, default to None.
+        shared_output : bool, optional
+            Whether every chore should append its output to the shared
+            ``base_dir/stdout`` and ``base_dir/stderr`` files instead of
+            creating a pair of files in each chore's workdir, defaults to False.
+            Flux labels each shared line only with its task rank, so lines
+            from different chores cannot be attributed to a chore; leave this
+            off when per-chore output matters.
+        max_in_flight : int, optional
+            The most chores that may be running at once even if the allocation
+            has room for more, defaults to None (limited only by resources).
+        flux_uri : str, optional
+            The URI of the Flux instance to run the chores in, e.g. a child
+            instance started with ``flux batch`` or ``flux alloc``, defaults to
+            None (the enclosing instance). Running one manager per child
+            instance spreads an ensemble over several Flux schedulers.
+        submit_fanout : int, optional
+            The most submissions that may be waiting on Flux's job-ingest
+            module at once, defaults to 64.
+        manager_cpus : set[int], optional
+            CPUs to pin the thread that calls :meth:`run` to, along with the
+            executor and logging threads it starts, so chores running on the
+            same node do not delay the manager's callbacks. The calling
+            thread's original affinity is restored when :meth:`run` returns.
+            Defaults to None (no pinning). Pinning is best effort and is
+            skipped where the platform does not support it.
 
         Return
         ------
@@ -105,6 +182,10 @@ class FluxManager:
                 "MatEnsemble restart/checkpoint files are not supported yet. "
                 "Leave write_restart_freq=None."
             )
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if submit_fanout < 1:
+            raise ValueError("submit_fanout must be >= 1")
         if not chore_list:
             raise Exception(
                 f"Error: expected chore_list to be a `list[Chore]` instead got {chore_list}"
@@ -119,13 +200,16 @@ class FluxManager:
 
         # dictionary to reference chore objects by their chore-id
         self._chores_by_id = {chore.id: chore for chore in chore_list}
-        self._dependents = {chore.id: [] for chore in chore_list}
         self._remaining_deps = {chore.id: len(chore.deps) for chore in chore_list}
 
-        # ensuring that chores have their correct dependencies
+        # ensuring that chores have their correct dependencies; only chores
+        # that something depends on get a list, most leaves need none
+        self._dependents = {}
         for chore in chore_list:
             for dep in chore.deps:
-                self._dependents[dep].append(chore.id)
+                if dep not in self._chores_by_id:
+                    raise KeyError(dep)
+                self._dependents.setdefault(dep, []).append(chore.id)
 
         self._ready_order = {}
         self._ready_order_counter = 0
@@ -137,24 +221,55 @@ class FluxManager:
                 self._mark_ready(chore_id)
 
         # queue for chores that are waiting on their dependencies to finish
-        self._blocked = set(self._chores_by_id.keys()) - set(self._ready)
+        self._blocked = set(self._chores_by_id).difference(self._ready)
 
         # main queues for running chores and completed chores
-        self._running_chores = set()
-        self._completed_chores = []
+        self._running_chores = {}
+        self._completed_chores = set()
         self._failed_chores = []
-        self._futures = set()
+        self._failed_ids = set()
+        self._completed_futures = queue.SimpleQueue()
+        self._max_in_flight = max_in_flight
+        self._peak_in_flight = 0
+
+        # free resources are measured by _check_resources once run() starts;
+        # _dynopro mirrors run(dynopro=...) for the strategies' backfilling
+        self._free_cores = 0
+        self._free_gpus = 0
+        self._resources_checked_at = None
+        self._dynopro = False
+        self._strategy_cache = {}
+        self._last_progress = None
+        self._last_progress_time = 0.0
 
         # acquiring a flux handle
-        self._flux_handle = flux.Flux()
-        self._fluxlet = Fluxlet(self._flux_handle)
+        self._flux_uri = flux_uri
+        self._manager_cpus = None if manager_cpus is None else set(manager_cpus)
+        self._flux_handle = _get_flux_handle(flux_uri)
+        self._nnodes_on_allocation, self._cores_per_node, self._gpus_per_node = (
+            self._get_allocation_info()
+        )
+
+        # the fluxlet reuses the allocation measured above instead of draining
+        # and listing the resources a second time
+        if shared_output:
+            self._fluxlet = Fluxlet(
+                self._flux_handle,
+                fanout=submit_fanout,
+                allocation=(self._nnodes_on_allocation, self._gpus_per_node),
+                shared_stdout_path=self._base_dir / "stdout",
+                shared_stderr_path=self._base_dir / "stderr",
+            )
+        else:
+            self._fluxlet = Fluxlet(
+                self._flux_handle,
+                fanout=submit_fanout,
+                allocation=(self._nnodes_on_allocation, self._gpus_per_node),
+            )
 
         self._write_restart_freq = write_restart_freq
 
         # setup logging
-        self._nnodes_on_allocation, self._cores_per_node, self._gpus_per_node = (
-            self._get_allocation_info()
-        )
         self._set_cpu_affinity = set_cpu_affinity
         self._set_gpu_affinity = set_gpu_affinity
 
@@ -167,17 +282,15 @@ class FluxManager:
         self._logger = _setup_logger(self._base_dir)
 
     def _next_ready_order(self) -> int:
-        order = getattr(self, "_ready_order_counter", 0)
+        order = self._ready_order_counter
         self._ready_order_counter = order + 1
         return order
 
     def _ready_sort_key(self, chore_id: str) -> tuple[int, int]:
-        if not hasattr(self, "_ready_order"):
-            self._ready_order = {}
         if chore_id not in self._ready_order:
             self._ready_order[chore_id] = self._next_ready_order()
         chore = self._chores_by_id[chore_id]
-        return (getattr(chore, "nice", 0), self._ready_order[chore_id])
+        return (chore.nice, self._ready_order[chore_id])
 
     def _sort_ready(self) -> None:
         self._ready = deque(sorted(self._ready, key=self._ready_sort_key))
@@ -186,11 +299,67 @@ class FluxManager:
         if chore_id in self._ready:
             self._sort_ready()
             return
-        if not hasattr(self, "_ready_order"):
-            self._ready_order = {}
         self._ready_order[chore_id] = self._next_ready_order()
-        self._ready.append(chore_id)
-        self._sort_ready()
+
+        # _ready is kept sorted, so the new chore is inserted in place instead of
+        # re-sorting the whole queue. It carries the newest order, so unless a
+        # queued chore has a larger nice value it simply goes at the end.
+        key = self._ready_sort_key(chore_id)
+        if not self._ready or self._ready_sort_key(self._ready[-1]) <= key:
+            self._ready.append(chore_id)
+        else:
+            index = bisect.bisect_right(self._ready, key, key=self._ready_sort_key)
+            self._ready.insert(index, chore_id)
+
+    def _pin_manager_thread(self) -> set[int] | None:
+        """
+        Pins the calling thread to ``_manager_cpus`` and returns the affinity it
+        had before, or None if it was left alone. Only threads started
+        afterwards inherit the new affinity, so the executor, progress-logging
+        and metadata threads started by :meth:`run` follow it. The log listener
+        thread is started in ``__init__`` and stays unpinned until the log
+        flush at the end of :meth:`run` restarts it.
+        """
+
+        if self._manager_cpus is None or not hasattr(os, "sched_setaffinity"):
+            return None
+        try:
+            previous = os.sched_getaffinity(0)
+            os.sched_setaffinity(0, self._manager_cpus)
+        except OSError:
+            self._logger.warning(
+                "Could not pin the manager to CPUs %s", sorted(self._manager_cpus)
+            )
+            return None
+        return previous
+
+    @contextlib.contextmanager
+    def _manager_cpu_affinity(self):
+        """
+        Pins the calling thread to ``_manager_cpus`` for the duration of the
+        block and restores its original affinity afterwards, so a caller's
+        thread is not left pinned once :meth:`run` returns
+        """
+
+        previous = self._pin_manager_thread()
+        try:
+            yield
+        finally:
+            if previous is not None:
+                with contextlib.suppress(OSError):
+                    os.sched_setaffinity(0, previous)
+
+    def _builtin_strategy(self, adaptive: bool) -> FutureProcessingStrategy:
+        """
+        Return the built-in processing strategy for ``adaptive``, creating it on
+        first use and reusing it on later calls to :meth:`run`
+        """
+
+        strategy = self._strategy_cache.get(adaptive)
+        if strategy is None:
+            strategy_cls = AdaptiveStrategy if adaptive else NonAdaptiveStrategy
+            strategy = self._strategy_cache[adaptive] = strategy_cls(self)
+        return strategy
 
     def _make_restart(self) -> None:
         """
@@ -214,32 +383,58 @@ class FluxManager:
             "MatEnsemble restart/checkpoint files are not supported yet."
         )
 
-    def _log_progress(self) -> None:
+    def _log_progress(self, force: bool = False) -> None:
         """
         Update the status file and append a progress line in the log file
-        """
-        pending = len(self._ready) + len(self._blocked)
-        self._status_writer.update(
-            pending=pending,
-            ready=len(self._ready),
-            blocked=len(self._blocked),
-            running=len(self._running_chores),
-            completed=len(self._completed_chores),
-            failed=len(self._failed_chores),
-            free_cores=self._free_cores,
-            free_gpus=self._free_gpus,
-            failures=self._failed_chores,
-        )
 
-        self._logger.info(
-            "CHORES: Pending=%d Running=%d Completed=%d Failed=%d | RESOURCES: Free_cores=%d Free_gpus=%d",
-            pending,
+        Ticks whose counts match the previous update are skipped unless
+        ``force`` is set or ``_PROGRESS_HEARTBEAT`` seconds have passed, so an
+        idle workflow still refreshes the status file before the dashboard
+        considers it stale.
+        """
+        snapshot = (
+            len(self._ready),
+            len(self._blocked),
             len(self._running_chores),
             len(self._completed_chores),
             len(self._failed_chores),
             self._free_cores,
             self._free_gpus,
         )
+        now = time.monotonic()
+        if (
+            not force
+            and snapshot == self._last_progress
+            and now - self._last_progress_time < _PROGRESS_HEARTBEAT
+        ):
+            return
+        self._last_progress = snapshot
+        self._last_progress_time = now
+
+        ready, blocked, running, completed, failed, free_cores, free_gpus = snapshot
+        pending = ready + blocked
+        self._status_writer.update(
+            pending=pending,
+            ready=ready,
+            blocked=blocked,
+            running=running,
+            completed=completed,
+            failed=failed,
+            free_cores=free_cores,
+            free_gpus=free_gpus,
+            failures=self._failed_chores,
+        )
+
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "CHORES: Pending=%d Running=%d Completed=%d Failed=%d | RESOURCES: Free_cores=%d Free_gpus=%d",
+                pending,
+                running,
+                completed,
+                failed,
+                free_cores,
+                free_gpus,
+            )
 
     def _get_allocation_info(self) -> tuple[int, int, int]:
         """
@@ -247,6 +442,8 @@ class FluxManager:
         GPUs per node and number of CPUs per node.
         """
 
+        import flux.resource
+
         # drain broker rank first, then measure what is actually usable
         self._flux_handle.rpc("resource.drain", {"targets": "0"}).get()
 
@@ -262,6 +459,20 @@ class FluxManager:
         gpus_per_node = total_gpus // nnodes
         return nnodes, cores_per_node, gpus_per_node
 
+    def _chore_output_paths(self, chore: Chore) -> tuple[Path, Path]:
+        """
+        Return the ``(stdout, stderr)`` files a chore's output is written to,
+        which are the shared files in ``base_dir`` when ``shared_output`` is set
+        """
+
+        fluxlet = self._fluxlet
+        stdout = fluxlet.shared_stdout_path
+        stderr = fluxlet.shared_stderr_path
+        return (
+            chore.workdir / "stdout" if stdout is None else Path(stdout),
+            chore.workdir / "stderr" if stderr is None else Path(stderr),
+        )
+
     def _chore_resource_footprint(self, chore: Chore) -> tuple[int, int]:
         """
         Return ``(needed_cores, needed_gpus)`` for a chore.
@@ -324,19 +535,36 @@ class FluxManager:
                 )
                 self._fail_dependents(chore_id)
 
-    def _check_resources(self) -> None:
+    def _check_resources(self, max_age: float = 0.0) -> None:
         """
         Gets the available resources from Flux's Remote Procedure Call (RPC)
         and sets them as private fields
 
+        Parameters
+        ----------
+        max_age : float, optional
+            Skip the RPC if the last one was made less than this many seconds
+            ago and no chore has completed since. Submissions are already
+            subtracted from the free counts locally, so until something
+            completes the cached counts only miss changes made outside the
+            workflow. Defaults to 0.0, which always queries Flux.
+
         Return
         ------
         None
         """
 
+        now = time.monotonic()
+        checked_at = self._resources_checked_at
+        if checked_at is not None and now - checked_at < max_age:
+            return
+
+        import flux.resource
+
         resources = flux.resource.list.resource_list(self._flux_handle).get()
         self._free_cores = resources.free.ncores
         self._free_gpus = resources.free.ngpus
+        self._resources_checked_at = now
 
     def _can_submit_now(self, chore: Chore) -> bool:
         """
@@ -351,7 +579,7 @@ class FluxManager:
         Checks if a given chore_id has failed
         """
 
-        return any(item["chore_id"] == chore_id for item in self._failed_chores)
+        return chore_id in self._failed_ids
 
     def _record_failure(
         self,
@@ -365,25 +593,42 @@ class FluxManager:
         Logs the failure of a chore with its reason
         """
 
-        if self._has_failed(chore_id):
+        if chore_id in self._failed_ids:
             return
 
+        self._failed_ids.add(chore_id)
         self._failed_chores.append(
             {
                 "chore_id": chore_id,
                 "reason": reason,
                 "upstream": upstream,
                 "exception": exception,
+                "stderr": self._failure_stderr(chore_id),
             }
         )
 
+    def _failure_stderr(self, chore_id: str) -> str | None:
+        """
+        Return the stderr file of a failed chore relative to ``base_dir``, the
+        form the dashboard expects, or None if it lies outside ``base_dir``
+        """
+
+        chore = self._chores_by_id.get(chore_id)
+        if chore is None:
+            return None
+        _, stderr = self._chore_output_paths(chore)
+        try:
+            return stderr.relative_to(self._base_dir).as_posix()
+        except ValueError:
+            return None
+
     def _fail_dependents(self, failed_chore_id: str) -> None:
         """
         Cascades the failure of one chore to all of it dependents to avoid
         deadlocks.
         """
 
-        for dep_id in self._dependents.get(failed_chore_id, []):
+        for dep_id in self._dependents.get(failed_chore_id, ()):
             if dep_id in self._completed_chores or dep_id in self._running_chores:
                 continue
 
@@ -407,96 +652,200 @@ class FluxManager:
 
             self._fail_dependents(dep_id)
 
-    def _submit_one(
-        self, chore_id: str, buffer_time: float, dynopro: bool = False
-    ) -> None:
+    def _submit_batch(self, chore_ids: list[str], dynopro: bool = False) -> bool:
         """
-        Submits a :obj:`Chore` and does book-keeping all the queues and resources
-        count
+        Submits :obj:`Chore`'s whose resources have already been claimed and
+        does the queue book-keeping for the whole batch at once. All of the
+        jobspecs are prepared first so that the submissions themselves are
+        pipelined to Flux.
 
         Parameters
         ----------
-        buffer_time : float
-            The amount of time in seconds buffer the submission of :obj:`Chore`'s
+        chore_ids : list[str]
+            The chores to submit, in order
+        dynopro : bool
+            Whether the chores are dynopro chores
+
+        Return
+        ------
+        bool
+            Whether any chore in the batch was submitted
         """
 
-        chore = self._chores_by_id[chore_id]
+        fluxlet = self._fluxlet
+        prepared = []
+        for chore_id in chore_ids:
+            chore = self._chores_by_id[chore_id]
+            try:
+                jobspec = fluxlet.prepare(
+                    chore,
+                    set_cpu_affinity=self._set_cpu_affinity,
+                    set_gpu_affinity=self._set_gpu_affinity,
+                    dynopro=dynopro,
+                )
+            except Exception as e:
+                self._release_and_fail(chore, e)
+                continue
+            prepared.append((chore, jobspec))
+
+        # every jobspec is ready, so the submissions go to the executor back to
+        # back and Flux ingests them concurrently, up to the Fluxlet's fanout
+        executor = self._executor
+        on_done = self._completed_futures.put
+        futures = []
+        for chore, jobspec in prepared:
+            try:
+                fut = fluxlet.submit_prepared(executor, chore, jobspec)
+            except Exception as e:
+                self._release_and_fail(chore, e)
+                continue
+            fut.add_done_callback(on_done)
+            futures.append(fut)
 
-        try:
-            fut = self._fluxlet.submit(
-                self._executor,
-                chore,
-                set_cpu_affinity=self._set_cpu_affinity,
-                set_gpu_affinity=self._set_gpu_affinity,
-                dynopro=dynopro,
-            )
-        except Exception as e:
-            self._logger.exception("CHORE SUBMIT FAILED: chore=%s", chore_id)
-            self._record_failure(
-                chore_id,
-                reason="submit_exception",
-                exception=repr(e),
-            )
-            self._fail_dependents(chore_id)
-            self._blocked.discard(chore_id)
-            return
+        if not futures:
+            return False
 
-        self._blocked.discard(chore_id)
-        fut.chore_id = chore_id
-        fut.chore_obj = chore
-        self._running_chores.add(chore_id)
-        self._futures.add(fut)
+        submitted = {fut.chore_id: fut for fut in futures}
+        self._blocked.difference_update(submitted)
+        self._running_chores.update(submitted)
+        if len(self._running_chores) > self._peak_in_flight:
+            self._peak_in_flight = len(self._running_chores)
+        return True
+
+    def _release_and_fail(self, chore: Chore, e: Exception) -> None:
+        """
+        Hands back the resources claimed for a batched :obj:`Chore` whose
+        submission raised, then records the failure
+        """
 
         needed_cores, needed_gpus = self._chore_resource_footprint(chore)
-        self._free_cores -= needed_cores
-        self._free_gpus -= needed_gpus
-        time.sleep(buffer_time)
+        self._free_cores += needed_cores
+        self._free_gpus += needed_gpus
+        self._submit_failed(chore.id, e)
+
+    def _submit_failed(self, chore_id: str, e: Exception) -> None:
+        """
+        Records a :obj:`Chore` whose submission raised and fails its dependents
+        """
+
+        self._logger.exception("CHORE SUBMIT FAILED: chore=%s", chore_id)
+        self._record_failure(
+            chore_id,
+            reason="submit_exception",
+            exception=repr(e),
+        )
+        self._fail_dependents(chore_id)
+        self._blocked.discard(chore_id)
 
-    def _submit_until_ooresources(
-        self, buffer_time: float, dynopro: bool = False
-    ) -> bool:
+    def _collect_completed(self, timeout: float | None) -> set:
         """
-        Submit as many chores as possible until out-of-resources
+        Wait up to ``timeout`` seconds for a running chore to finish and return
+        every future that has completed since the last call
+
+        Completions arrive through the done callbacks registered in
+        :meth:`_submit_batch`, so the cost is proportional to the number of
+        finished chores instead of the number still running.
 
         Parameters
         ----------
-        buffer_time : float
-            The amount of time in seconds buffer the submission of :obj:`Chore`'s
+        timeout : float, None
+            The longest amount of time to wait for the first completion, or
+            None to wait until one arrives
+
+        Return
+        ------
+        set
+            The completed futures, whose chores are also removed from
+            ``_running_chores``
+        """
+
+        running = self._running_chores
+        if not running:
+            return set()
+
+        completions = self._completed_futures
+        completed = set()
+        try:
+            completed.add(completions.get(timeout=timeout))
+            while True:
+                completed.add(completions.get_nowait())
+        except queue.Empty:
+            pass
+
+        # ignore anything no longer tracked, e.g. a future collected by a wait()
+        # before its callback fired
+        completed = {fut for fut in completed if running.get(fut.chore_id) is fut}
+        for fut in completed:
+            del running[fut.chore_id]
+        if completed:
+            # completions free resources that the cached counts do not know of
+            self._resources_checked_at = None
+        return completed
+
+    def _submit_until_ooresources(self, dynopro: bool = False) -> bool:
+        """
+        Submit as many chores as possible until out-of-resources. Every chore
+        that fits is claimed first and the whole batch is then submitted
+        without pausing between submissions.
+
+        Parameters
+        ----------
+        dynopro : bool
+            Whether the chores are dynopro chores
         """
 
+        if not self._ready:
+            return False
+        if self._resources_checked_at is None:
+            # A completion invalidated the cached counts, so reconcile with
+            # Flux before sizing the batch. Incrementing local counters instead
+            # could double-count resources a query already saw as free.
+            self._check_resources()
+
         deferred = deque()
+        batch = []
         submitted_any = False
+        max_in_flight = self._max_in_flight
 
         while self._ready:
+            in_flight = len(self._running_chores) + len(batch)
+            if max_in_flight is not None and in_flight >= max_in_flight:
+                # leave the rest queued, in order, until running chores drain
+                deferred.extend(self._ready)
+                self._ready.clear()
+                break
+
             chore_id = self._ready.popleft()
             chore = self._chores_by_id[chore_id]
 
-            if self._can_submit_now(chore):
-                self._submit_one(chore_id, buffer_time, dynopro=dynopro)
-                submitted_any = True
-            else:
+            if not self._can_submit_now(chore):
                 deferred.append(chore_id)
+            else:
+                # claim the resources now so the rest of the queue sees them
+                # as taken, and submit everything that fits in one batch
+                needed_cores, needed_gpus = self._chore_resource_footprint(chore)
+                self._free_cores -= needed_cores
+                self._free_gpus -= needed_gpus
+                batch.append(chore_id)
 
         self._ready = deferred
+        if batch and self._submit_batch(batch, dynopro=dynopro):
+            submitted_any = True
         return submitted_any
 
-    def _log_worker(self, delay: float) -> None:
+    def _log_worker(self, delay: float, finished: threading.Event) -> None:
         """
-        Function that updates the logs every so often
+        Function that updates the logs every ``delay`` seconds until ``finished``
+        is set
+
+        The end of the run is signalled explicitly rather than inferred from the
+        queues, which are all briefly empty while a batch is being submitted.
         """
-        done = (
-            len(self._ready) == 0
-            and len(self._running_chores) == 0
-            and len(self._blocked) == 0
-        )
-        while not done:
+        while True:
             self._log_progress()
-            time.sleep(delay)
-            done = (
-                len(self._ready) == 0
-                and len(self._running_chores) == 0
-                and len(self._blocked) == 0
-            )
+            _flush_log_buffer()
+            if finished.wait(delay):
+                return
 
     def _add_chore(self, chore: Chore) -> bool:
         """
@@ -545,7 +894,6 @@ class FluxManager:
                 return False
 
         self._chores_by_id[chore.id] = chore
-        self._dependents.setdefault(chore.id, [])
 
         remaining = sum(1 for dep in chore.deps if dep not in self._completed_chores)
         self._remaining_deps[chore.id] = remaining
@@ -577,7 +925,8 @@ class FluxManager:
         Parameters
         ----------
         buffer_time : float
-            The amount of time in seconds buffer the submission of :obj:`Chore`'s
+            The longest amount of time in seconds to wait for a running
+            :obj:`Chore` to complete before checking for new work
         log_delay : float
             The amount of time in seconds that the log files will be written to
         adaptive : bool
@@ -600,7 +949,7 @@ class FluxManager:
 
         Each loop iteration:
 
-        #. Refreshes available resources
+        #. Refreshes available resources if any chores are ready to submit
         #. Prints a progress snapshot
         #. Submits new chores until resources are exhausted
         #. processes completed chores using a FutureProcessingStrategy:
@@ -611,56 +960,81 @@ class FluxManager:
 
         if processing_strategy:
             proc_strat = processing_strategy
-        elif adaptive:
-            proc_strat = AdaptiveStrategy(self)
         else:
-            proc_strat = NonAdaptiveStrategy(self)
+            proc_strat = self._builtin_strategy(adaptive)
 
         buffer_time = 0.0 if buffer_time is None else float(buffer_time)
+        self._dynopro = dynopro
 
-        self._flux_handle.rpc("resource.drain", {"targets": "0"}).get()
-        with flux.job.FluxExecutor() as executor:
-            self._executor = executor
-
-            if restarting:
-                self._logger.info("=== RESTARTING WORKFLOW ENVIRONMENT ===")
-            else:
-                self._logger.info("=== ENTERING WORKFLOW ENVIRONMENT ===")
-                self._start_time = time.perf_counter()
+        import flux.job
 
-            # starting a thread to continueally log every {log_delay} seconds
-            self._check_resources()
-            logging_thread = threading.Thread(
-                target=self._log_worker,
-                args=(log_delay,),
-                daemon=True,
-            )
-            logging_thread.start()
+        # pin before the executor starts so that its threads inherit the affinity
+        handle_args = () if self._flux_uri is None else (self._flux_uri,)
+        with (
+            self._manager_cpu_affinity(),
+            flux.job.FluxExecutor(handle_args=handle_args) as executor,
+        ):
+            self._executor = executor
 
-            self._validate_chores()
+            run_finished = threading.Event()
+            try:
+                if restarting:
+                    self._logger.info("=== RESTARTING WORKFLOW ENVIRONMENT ===")
+                else:
+                    self._logger.info("=== ENTERING WORKFLOW ENVIRONMENT ===")
+                    self._start_time = time.monotonic_ns()
 
-            ### Super Loop ###
-            done = (
-                len(self._ready) == 0
-                and len(self._running_chores) == 0
-                and len(self._blocked) == 0
-            )
-            while not done:
+                # starting a thread to continueally log every {log_delay} seconds
                 self._check_resources()
-                self._submit_until_ooresources(buffer_time=buffer_time, dynopro=dynopro)
-                proc_strat.process_futures(buffer_time=buffer_time)
-
-                done = (
-                    len(self._ready) == 0
-                    and len(self._running_chores) == 0
-                    and len(self._blocked) == 0
+                logging_thread = threading.Thread(
+                    target=self._log_worker,
+                    args=(log_delay, run_finished),
+                    daemon=True,
+                )
+                logging_thread.start()
+
+                self._validate_chores()
+                self._fluxlet.prepare_workdirs(
+                    map(
+                        self._chores_by_id.__getitem__,
+                        itertools.chain(self._ready, self._blocked),
+                    )
                 )
-            ### Super Loop ###
 
-            end = time.perf_counter()
-            logging_thread.join()
-            self._log_progress()
-            self._logger.info("=== EXITING WORKFLOW ENVIRONMENT ===")
-            self._logger.info(
-                "Workflow took %.4f seconds to run.", end - self._start_time
-            )
+                # the strategy and the containers that are never rebound are
+                # fixed for the whole run, so they are looked up once here;
+                # _ready is rebound by the submission path and stays on self
+                check_resources = self._check_resources
+                submit = self._submit_until_ooresources
+                process_futures = proc_strat.process_futures
+                running = self._running_chores
+                blocked = self._blocked
+
+                ### Super Loop ###
+                while self._ready or running or blocked:
+                    # Submissions are accounted for locally and the submit path
+                    # reconciles after completions, so Flux is only queried here
+                    # when there is ready work waiting on capacity, and at most
+                    # once per buffer_time while nothing has completed.
+                    if self._ready:
+                        check_resources(max_age=buffer_time)
+                    submit(dynopro=dynopro)
+                    process_futures(buffer_time=buffer_time)
+                ### Super Loop ###
+
+                end = time.monotonic_ns()
+                run_finished.set()
+                logging_thread.join()
+                self._log_progress(force=True)
+                self._logger.info("=== EXITING WORKFLOW ENVIRONMENT ===")
+                self._logger.info(
+                    "Workflow took %.4f seconds to run.",
+                    (end - self._start_time) / 1e9,
+                )
+                self._logger.info(
+                    "Peak chores in flight: %d", self._peak_in_flight
+                )
+            finally:
+                run_finished.set()
+                self._fluxlet.flush_metadata()
+                _flush_log_listener()
@@ -21,18 +21,16 @@ class OutputReference:
 
         dep_result = self.workdir / "result.pickle"
         try:
-            with dep_result.open("rb") as f:
-                return str(pickle.load(f))
+            return str(pickle.loads(dep_result.read_bytes()))
         except Exception as e:
             return f"Error: Could not open result of chore: {self.chore_id} because of the following exception: {e}"
 
     def result(self):
         dep_result = self.workdir / "result.pickle"
-        with dep_result.open("rb") as f:
-            return pickle.load(f)
+        return pickle.loads(dep_result.read_bytes())
 
 
-@dataclass
+@dataclass(slots=True)
 class Resources:
     """
     The resources that a wrapped flux job needs
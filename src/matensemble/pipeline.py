@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import atexit
+import os
 import threading
 import time
 import copy
+import dataclasses
 import functools
 import datetime
 import sys
 
 import networkx as nx
 
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Callable, Any
 from pathlib import Path
 
@@ -84,11 +86,14 @@ class Pipeline:
         self._registry = registry if registry is not None else ChoreRegistry()
         self._output_reference_list: list[OutputReference] = []
 
-        root = Path.cwd() if basedir is None else Path(basedir)
+        # made absolute once here so that every chore workdir derived from it is
+        # already absolute and never needs another getcwd/resolve per chore
+        root = Path.cwd() if basedir is None else Path(os.path.abspath(basedir))
         self._base_dir = (
             root / f"matensemble_workflow-{datetime.datetime.now():%Y%m%d_%H%M%S}"
         )
         self._out_dir = self._base_dir / "out"
+        self._source_root = str(root.resolve())
 
         self._strategy_spec = None
         self._finished = False
@@ -98,7 +103,7 @@ class Pipeline:
         self._submission_future: Future | None = None
 
     def _merge_pythonpath(self, env: dict[str, str] | None) -> dict[str, str]:
-        source_root = str(self._base_dir.parent.resolve())
+        source_root = self._source_root
         merged_env = dict(env or {})
         old_pythonpath = merged_env.get("PYTHONPATH")
 
@@ -117,7 +122,7 @@ class Pipeline:
             "--chore-id",
             chore_id,
             "--spec-file",
-            str(workdir / "chore.pickle"),
+            os.path.join(workdir, "chore.pickle"),
         ]
 
     def _enqueue_registered(
@@ -129,8 +134,11 @@ class Pipeline:
         nice: int = 0,
     ) -> OutputReference:
         entry = self._registry.get(name)
-        res = copy.deepcopy(resources if resources is not None else entry.resources)
-        res.env = self._merge_pythonpath(res.env)
+        # Resources only holds scalars and the env dict, which _merge_pythonpath
+        # already copies, so a shallow replace is enough to keep the registry
+        # entry untouched
+        base = resources if resources is not None else entry.resources
+        res = dataclasses.replace(base, env=self._merge_pythonpath(base.env))
 
         self._counter += 1
         chore_id = f"chore-{entry.id_name}-{self._counter:04d}"
@@ -655,8 +663,10 @@ class Pipeline:
             *self._runtime_worker_command(chore_id, workdir),
         ]
 
-        args = copy.deepcopy(spec.args)
-        kwargs = copy.deepcopy(spec.kwargs)
+        # the spec was just unpickled from result.pickle and nothing else holds
+        # a reference to it, so its args are used as-is instead of deep copied
+        args = spec.args
+        kwargs = spec.kwargs
         deps = _collect_dep_ids(args, kwargs)
 
         chore = Chore(
@@ -902,8 +912,8 @@ class Pipeline:
             Restart/checkpoint files are not supported yet. Leave this as
             ``None``. Passing an integer raises :exc:`NotImplementedError`.
         buffer_time : float
-            The amount of seconds that the :obj:`FluxManager` should wait between
-            submission of chores, defaults to 1.0s.
+            The longest amount of seconds that the :obj:`FluxManager` waits for
+            a running chore to complete, defaults to 1.0s.
         log_delay : float
             The amount delay in seconds between the writing of logs
         set_cpu_affinity : bool
@@ -965,7 +975,14 @@ class Pipeline:
         """
         deadline = time.monotonic() + timeout
 
-        # if the workflow is not finished spin wait until it is or you reach a timeout
+        # the submission future completes the moment the workflow ends, so
+        # block on it instead of waking up to poll the finished flag
+        with self._submission_state_lock:
+            submission = self._submission_future
+        if submission is not None:
+            wait((submission,), timeout=timeout)
+
+        # without a submission future, spin wait until finished or timed out
         while True:
             with self._submission_state_lock:
                 finished = self._finished
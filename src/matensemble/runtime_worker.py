@@ -47,8 +47,12 @@ When Flux starts that command on an allocated worker, this module:
 """
 
 import argparse
+import contextlib
+import mmap
+import os
 import pickle
 import sys
+import tempfile
 
 import cloudpickle
 
@@ -62,9 +66,21 @@ def _load_callable(chore_qualname: str, registry: Path):
     Loads the function from the registry
     """
 
-    func = registry / chore_qualname
-    with func.open("rb") as f:
-        return cloudpickle.load(f)
+    return cloudpickle.loads((registry / chore_qualname).read_bytes())
+
+
+def _load_pickle(path: Path):
+    """
+    Unpickles a dependency result by mapping it into memory, so large results
+    are read in one pass by the page cache instead of being copied through a
+    file buffer
+    """
+
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise EOFError(f"{path} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return pickle.loads(mm)
 
 
 def _load_dep_result(spec_file: Path, dep_id: str):
@@ -72,9 +88,7 @@ def _load_dep_result(spec_file: Path, dep_id: str):
     Loads the results of the dependencies and returns them
     """
 
-    dep_result = spec_file.parent.parent / dep_id / "result.pickle"
-    with dep_result.open("rb") as f:
-        return pickle.load(f)
+    return _load_pickle(spec_file.parent.parent / dep_id / "result.pickle")
 
 
 def main():
@@ -98,8 +112,7 @@ def main():
 
     spec_file = Path(ns.spec_file).resolve()
 
-    with spec_file.open("rb") as f:
-        chore = pickle.load(f)
+    chore = pickle.loads(spec_file.read_bytes())
 
     if ns.chore_id != chore.id:
         raise ValueError(
@@ -122,8 +135,19 @@ def main():
 
     result = func(*args, **kwargs)
 
-    with (spec_file.parent / "result.pickle").open("wb") as f:
-        pickle.dump(result, f)
+    # write next to the final path and rename so a worker killed mid-dump never
+    # leaves a truncated result.pickle behind for downstream chores to load
+    result_file = spec_file.parent / "result.pickle"
+    fd, temp_name = tempfile.mkstemp(dir=spec_file.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, result_file)
+    except BaseException:
+        # a failed dump must not leave a partial temp file in the workdir
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
 
 
 if __name__ == "__main__":
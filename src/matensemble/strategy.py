@@ -1,11 +1,6 @@
 import traceback
-
-import concurrent.futures
 import pickle
 
-import flux
-import flux.job.executor
-
 from datetime import datetime
 from pathlib import Path
 
@@ -30,6 +25,91 @@ class FutureProcessingStrategy(ABC):
         """
         pass
 
+    def _handle_completed(self, fut) -> bool:
+        """
+        Record the outcome of a finished future on the manager
+
+        A chore that raised or exited nonzero is recorded as failed along with
+        its dependents. Otherwise it is marked completed and any dependents
+        left with no unfinished dependencies become ready.
+
+        Parameters
+        ----------
+        fut : FluxExecutorFuture
+            A completed future returned by the manager's collection step
+
+        Return
+        ------
+        bool
+            True if the chore completed successfully
+        """
+
+        chore_id = getattr(fut, "chore_id")
+        chore = getattr(fut, "chore_obj")
+
+        try:
+            rc = fut.result()
+        except Exception as e:
+            tb = traceback.format_exc()
+            stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+            # failure notes go next to the chore's own stderr, which is the
+            # shared file when the manager uses shared output
+            _, stderr = self.manager._chore_output_paths(chore)
+            append_text(
+                stderr,
+                (
+                    f"\n\n===== MATENSEMBLE WRAPPER ERROR ({stamp}) =====\n"
+                    f"chore={chore_id}\n"
+                    f"workdir={chore.workdir}\n"
+                    f"{type(e).__name__}: {e}"
+                    f"{tb}\n"
+                ),
+            )
+            self.manager._logger.exception("CHORE FAILED: chore=%s", chore_id)
+            self.manager._record_failure(
+                chore_id,
+                reason="exception",
+                exception=f"{type(e).__name__}: {e}",
+            )
+            self.manager._fail_dependents(chore_id)
+            return False
+
+        # rc 134 is a double free or corruption error caused by lammps-symmetrix in the
+        # in the frontier image during lammps cleanup
+        # the function will still complete successfully and produce a result.pickle file
+        # so if we can safely ignore the return code
+        if rc != 0 and rc != 134:
+            stdout, stderr = self.manager._chore_output_paths(chore)
+            append_text(
+                stderr,
+                f"\n\n===== MATENSEMBLE: NONZERO EXIT =====\nchore={chore_id} rc={rc}\n",
+            )
+            self.manager._logger.error(
+                "CHORE NONZERO EXIT: chore=%s rc=%s | workdir=%s | stdout=%s | stderr=%s",
+                chore_id,
+                rc,
+                chore.workdir,
+                stdout,
+                stderr,
+            )
+            self.manager._record_failure(
+                chore_id,
+                reason=f"nonzero_exit:{rc}",
+            )
+            self.manager._fail_dependents(chore_id)
+            return False
+
+        self.manager._completed_chores.add(chore_id)
+
+        for dep_id in self.manager._dependents.get(chore_id, ()):
+            self.manager._remaining_deps[dep_id] -= 1
+            if self.manager._remaining_deps[dep_id] == 0:
+                self.manager._mark_ready(dep_id)
+                self.manager._blocked.discard(dep_id)
+
+        return True
+
 
 class AdaptiveStrategy(FutureProcessingStrategy):
     """
@@ -57,88 +137,22 @@ class AdaptiveStrategy(FutureProcessingStrategy):
         Parameters
         ----------
         buffer_time : float
-            The amount of time to wait between chores being completed.
+            The longest amount of time to wait for a chore to complete. The
+            wait returns as soon as any running chore completes.
         """
 
-        completed, self.manager._futures = concurrent.futures.wait(
-            self.manager._futures, timeout=buffer_time
-        )
-        if completed:
-            # Reconcile with Flux before immediate backfilling. Incrementing
-            # local counters here could double-count resources already observed
-            # as free by an outer-loop resource query.
-            self.manager._check_resources()
+        # collecting completions invalidates the cached resource counts, so
+        # the first backfill below reconciles with Flux
+        completed = self.manager._collect_completed(timeout=buffer_time)
 
-        had_failure = False
+        submit = self.manager._submit_until_ooresources
+        dynopro = self.manager._dynopro
         for fut in completed:
-            chore_id = getattr(fut, "chore_id")
-            chore = getattr(fut, "chore_obj")
-            self.manager._running_chores.remove(chore_id)
-
-            try:
-                rc = fut.result()
-            except Exception as e:
-                tb = traceback.format_exc()
-                stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                append_text(
-                    chore.workdir / "stderr",
-                    (
-                        f"\n\n===== MATENSEMBLE WRAPPER ERROR ({stamp}) =====\n"
-                        f"chore={chore_id}\n"
-                        f"workdir={chore.workdir}\n"
-                        f"{type(e).__name__}: {e}"
-                        f"{tb}\n"
-                    ),
-                )
-                self.manager._logger.exception("CHORE FAILED: chore=%s", chore_id)
-                self.manager._record_failure(
-                    chore_id,
-                    reason="exception",
-                    exception=f"{type(e).__name__}: {e}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
-                continue
-
-            # rc 134 is a double free or corruption error caused by lammps-symmetrix in the
-            # in the frontier image during lammps cleanup
-            # the function will still complete successfully and produce a result.pickle file
-            # so if we can safely ignore the return code
-            if rc != 0 and rc != 134:
-                append_text(
-                    chore.workdir / "stderr",
-                    f"\n\n===== MATENSEMBLE: NONZERO EXIT =====\nchore={chore_id} rc={rc}\n",
-                )
-                self.manager._logger.error(
-                    "CHORE NONZERO EXIT: chore=%s rc=%s | workdir=%s | stdout=%s | stderr=%s",
-                    chore_id,
-                    rc,
-                    chore.workdir,
-                    chore.workdir / "stdout",
-                    chore.workdir / "stderr",
-                )
-                self.manager._record_failure(
-                    chore_id,
-                    reason=f"nonzero_exit:{rc}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
+            if not self._handle_completed(fut):
                 continue
 
-            self.manager._completed_chores.append(chore_id)
-
-            for dep_id in self.manager._dependents.get(chore_id, []):
-                self.manager._remaining_deps[dep_id] -= 1
-                if self.manager._remaining_deps[dep_id] == 0:
-                    self.manager._mark_ready(dep_id)
-                    self.manager._blocked.discard(dep_id)
-
             # adaptively submit another chore
-            self.manager._submit_until_ooresources(
-                buffer_time=buffer_time,
-                dynopro=getattr(self.manager, "_dynopro", False),
-            )
+            submit(dynopro=dynopro)
 
             if self.manager._write_restart_freq and (
                 len(self.manager._completed_chores) % self.manager._write_restart_freq
@@ -146,9 +160,6 @@ class AdaptiveStrategy(FutureProcessingStrategy):
             ):
                 self.manager._make_restart()
 
-        if had_failure:
-            return
-
 
 class NonAdaptiveStrategy(FutureProcessingStrategy):
     """
@@ -165,84 +176,20 @@ class NonAdaptiveStrategy(FutureProcessingStrategy):
     def process_futures(self, buffer_time) -> None:
         # Deliberately omit a timeout: non-adaptive scheduling drains the whole
         # current wave before returning control to the manager's submit phase.
-        completed, self.manager._futures = concurrent.futures.wait(
-            self.manager._futures
-        )
+        completed = set()
+        while self.manager._running_chores:
+            completed |= self.manager._collect_completed(timeout=None)
 
-        had_failure = False
         for fut in completed:
-            chore_id = getattr(fut, "chore_id")
-            chore = getattr(fut, "chore_obj")
-            self.manager._running_chores.remove(chore_id)
-
-            try:
-                rc = fut.result()
-            except Exception as e:
-                tb = traceback.format_exc()
-                stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                append_text(
-                    chore.workdir / "stderr",
-                    (
-                        f"\n\n===== MATENSEMBLE WRAPPER ERROR ({stamp}) =====\n"
-                        f"chore={chore_id}\n"
-                        f"workdir={chore.workdir}\n"
-                        f"{type(e).__name__}: {e}"
-                        f"{tb}\n"
-                    ),
-                )
-                self.manager._logger.exception("CHORE FAILED: chore=%s", chore_id)
-                self.manager._record_failure(
-                    chore_id,
-                    reason="exception",
-                    exception=f"{type(e).__name__}: {e}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
-                continue
-
-            # rc 134 is a double free or corruption error caused by lammps-symmetrix in the
-            # in the frontier image during lammps cleanup
-            # the function will still complete successfully and produce a result.pickle file
-            # so if we can safely ignore the return code
-            if rc != 0 and rc != 134:
-                append_text(
-                    chore.workdir / "stderr",
-                    f"\n\n===== MATENSEMBLE: NONZERO EXIT =====\nchore={chore_id} rc={rc}\n",
-                )
-                self.manager._logger.error(
-                    "CHORE NONZERO EXIT: chore=%s rc=%s | workdir=%s | stdout=%s | stderr=%s",
-                    chore_id,
-                    rc,
-                    chore.workdir,
-                    chore.workdir / "stdout",
-                    chore.workdir / "stderr",
-                )
-                self.manager._record_failure(
-                    chore_id,
-                    reason=f"nonzero_exit:{rc}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
+            if not self._handle_completed(fut):
                 continue
 
-            self.manager._completed_chores.append(chore_id)
-
-            for dep_id in self.manager._dependents.get(chore_id, []):
-                self.manager._remaining_deps[dep_id] -= 1
-                if self.manager._remaining_deps[dep_id] == 0:
-                    self.manager._mark_ready(dep_id)
-                    self.manager._blocked.discard(dep_id)
-
             if self.manager._write_restart_freq and (
                 len(self.manager._completed_chores) % self.manager._write_restart_freq
                 == 0
             ):
                 self.manager._make_restart()
 
-        if had_failure:
-            return
-
 
 class UserStrategy(FutureProcessingStrategy):
     def __init__(
@@ -260,86 +207,27 @@ class UserStrategy(FutureProcessingStrategy):
         #     )
 
     def process_futures(self, buffer_time) -> None:
-        completed, self.manager._futures = concurrent.futures.wait(
-            self.manager._futures, timeout=buffer_time
-        )
-        if completed:
-            self.manager._check_resources()
+        completed = self.manager._collect_completed(timeout=buffer_time)
 
-        had_failure = False
+        submit = self.manager._submit_until_ooresources
+        dynopro = self.manager._dynopro
         for fut in completed:
             chore_id = getattr(fut, "chore_id")
             chore = getattr(fut, "chore_obj")
             chore_name = chore_id.removeprefix("chore-").rsplit("-", 1)[0]
-            self.manager._running_chores.remove(chore_id)
-
-            try:
-                rc = fut.result()
-            except Exception as e:
-                tb = traceback.format_exc()
-                stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                append_text(
-                    chore.workdir / "stderr",
-                    (
-                        f"\n\n===== MATENSEMBLE WRAPPER ERROR ({stamp}) =====\n"
-                        f"chore={chore_id}\n"
-                        f"workdir={chore.workdir}\n"
-                        f"{type(e).__name__}: {e}"
-                        f"{tb}\n"
-                    ),
-                )
-                self.manager._logger.exception("CHORE FAILED: chore=%s", chore_id)
-                self.manager._record_failure(
-                    chore_id,
-                    reason="exception",
-                    exception=f"{type(e).__name__}: {e}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
-                continue
 
-            # rc 134 is a double free or corruption error caused by lammps-symmetrix in the
-            # in the frontier image during lammps cleanup
-            # the function will still complete successfully and produce a result.pickle file
-            # so if we can safely ignore the return code
-            if rc != 0 and rc != 134:
-                append_text(
-                    chore.workdir / "stderr",
-                    f"\n\n===== MATENSEMBLE: NONZERO EXIT =====\nchore={chore_id} rc={rc}\n",
-                )
-                self.manager._logger.error(
-                    "CHORE NONZERO EXIT: chore=%s rc=%s | workdir=%s | stdout=%s | stderr=%s",
-                    chore_id,
-                    rc,
-                    chore.workdir,
-                    chore.workdir / "stdout",
-                    chore.workdir / "stderr",
-                )
-                self.manager._record_failure(
-                    chore_id,
-                    reason=f"nonzero_exit:{rc}",
-                )
-                self.manager._fail_dependents(chore_id)
-                had_failure = True
+            if not self._handle_completed(fut):
                 continue
 
-            self.manager._completed_chores.append(chore_id)
-
-            for dep_id in self.manager._dependents.get(chore_id, []):
-                self.manager._remaining_deps[dep_id] -= 1
-                if self.manager._remaining_deps[dep_id] == 0:
-                    self.manager._mark_ready(dep_id)
-                    self.manager._blocked.discard(dep_id)
-
             # --- Processing the chore and spawning the new one ---
             if chore_name == self.proc_chore:
                 try:
                     # Trust boundary: result.pickle is written by matensemble.runtime_worker
                     # in this workflow's chore workdir only—do not load pickles from
                     # untrusted paths or third-party producers.
-                    with (chore.workdir / "result.pickle").open("rb") as f:
-                        chore_spec = pickle.load(f)
+                    chore_spec = pickle.loads(
+                        (chore.workdir / "result.pickle").read_bytes()
+                    )
                     if chore_spec:
                         new_chore, new_out = self.pipeline._spawn_chore_from_spec(
                             chore_spec
@@ -349,7 +237,9 @@ class UserStrategy(FutureProcessingStrategy):
                         )
                 except Exception as e:
                     self.manager._logger.exception(
-                        f"FAILED TO SPAWN CHORE: chore={self.proc_chore} | due the following Exception ->\n{e}"
+                        "FAILED TO SPAWN CHORE: chore=%s | due the following Exception ->\n%s",
+                        self.proc_chore,
+                        e,
                     )
             else:
                 for bolo_name in self.bolo_list:
@@ -364,15 +254,15 @@ class UserStrategy(FutureProcessingStrategy):
                             )
                         except Exception as e:
                             self.manager._logger.exception(
-                                f"FAILED TO SPAWN CHORE: proc_chore={self.proc_chore} "
-                                f"bolo_match={chore_name} | due the following Exception ->\n{e}"
+                                "FAILED TO SPAWN CHORE: proc_chore=%s bolo_match=%s "
+                                "| due the following Exception ->\n%s",
+                                self.proc_chore,
+                                chore_name,
+                                e,
                             )
 
             # adaptively submit another chore
-            self.manager._submit_until_ooresources(
-                buffer_time=buffer_time,
-                dynopro=getattr(self.manager, "_dynopro", False),
-            )
+            submit(dynopro=dynopro)
 
             if self.manager._write_restart_freq and (
                 len(self.manager._completed_chores) % self.manager._write_restart_freq
@@ -380,9 +270,6 @@ class UserStrategy(FutureProcessingStrategy):
             ):
                 self.manager._make_restart()
 
-        if had_failure:
-            return
-
 
 def append_text(path: Path, text: str) -> None:
     """
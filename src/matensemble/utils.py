@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import json
 from typing import Any
 
@@ -20,24 +21,45 @@ def _dashboard_import_error() -> RuntimeError:
     )
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Write all of ``data`` to the file descriptor ``fd``
+
+    ``os.write`` may write fewer bytes than it was given, so keep writing the
+    remainder until nothing is left.
+    """
+
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+_JSON_SEQUENCE_TYPES = frozenset((list, tuple, set, frozenset))
+
+
 def _json_safe(value):
+    # exact-type checks first: chore args are overwhelmingly plain builtins, and
+    # a set lookup on type(value) is cheaper than walking the isinstance chain
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return value
+    if value_type in _JSON_SEQUENCE_TYPES:
+        return [_json_safe(v) for v in value]
+    if value_type is dict:
+        return {str(k): _json_safe(v) for k, v in value.items()}
+
     if isinstance(value, Path):
         return str(value)
     if isinstance(value, Enum):
         return value.name
     if isinstance(value, OutputReference):
         return {"__type__": "OutputReference", "chore_id": value.chore_id}
-    if isinstance(value, tuple):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, list):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, set):
-        return [_json_safe(v) for v in value]
-    if isinstance(value, frozenset):
+    if isinstance(value, (tuple, list, set, frozenset)):
         return [_json_safe(v) for v in value]
     if isinstance(value, dict):
         return {str(k): _json_safe(v) for k, v in value.items()}
-    if isinstance(value, (str, int, float, bool)) or value is None:
+    if isinstance(value, (str, int, float, bool)):
         return value
     return repr(value)
 
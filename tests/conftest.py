@@ -10,6 +10,9 @@ def _install_flux_stub() -> None:
     flux_resource_list_module = types.ModuleType("flux.resource.list")
 
     class _DummyExecutor:
+        def __init__(self, *args, **kwargs):
+            pass
+
         def __enter__(self):
             return self
 
@@ -38,6 +41,9 @@ def _install_flux_stub() -> None:
             return self._exception
 
     class _DummyFlux:
+        def __init__(self, *args, **kwargs):
+            pass
+
         def rpc(self, *_args, **_kwargs):
             class _RpcResult:
                 def get(self):
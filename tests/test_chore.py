@@ -18,6 +18,17 @@ def test_chore_normalizes_string_command():
     assert chore.spec_path.name == "chore.pickle"
 
 
+def test_chore_stringifies_list_command_arguments(tmp_path: Path):
+    chore = Chore(
+        id="chore-argv",
+        workdir=tmp_path / "chore-argv",
+        command=["run", 3, 0.5, tmp_path],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    assert chore.command == ["run", "3", "0.5", str(tmp_path)]
+
+
 def test_chore_write_metadata(tmp_path: Path):
     chore = Chore(
         id="chore-2",
@@ -215,6 +215,24 @@ def test_api_catalog_status_history_and_new_workflow(tmp_path: Path):
         assert len(client.get("/api/catalog").json()["workflows"]) == 2
 
 
+def test_api_stderr_follows_the_recorded_failure_path(tmp_path: Path):
+    payload = status_payload()
+    payload["failures"] = [
+        {"chore_id": "chore-shared", "reason": "nonzero_exit:1", "stderr": "stderr"},
+        {"chore_id": "chore-escape", "reason": "exception", "stderr": "../secret"},
+    ]
+    workflow = make_workflow(tmp_path, "", "20260622_143000", payload=payload)
+    (workflow / "stderr").write_text("shared failure note", encoding="utf-8")
+    (tmp_path / "secret").write_text("nope", encoding="utf-8")
+    app = create_dashboard_app(tmp_path, scan_interval=60)
+
+    with TestClient(app) as client:
+        identifier = client.get("/api/catalog").json()["workflows"][0]["id"]
+        base = f"/api/workflows/{identifier}/artifacts"
+        assert client.get(f"{base}/chore-shared/stderr").text == "shared failure note"
+        assert client.get(f"{base}/chore-escape/stderr").status_code == 400
+
+
 def test_api_artifacts_are_contained_and_missing_workflow_is_retained(tmp_path: Path):
     workflow = make_workflow(
         tmp_path, "", "20260622_143000", payload=status_payload()
@@ -1,3 +1,4 @@
+import json
 import pickle
 import sys
 
@@ -14,16 +15,28 @@ from matensemble.pipeline import Pipeline
 
 
 class _FakeJobspec:
-    def __init__(self):
-        self.cwd = None
-        self.stdout = None
-        self.stderr = None
+    def __init__(self, tasks=None, shell_opts=None, cwd=None, stdout=None, stderr=None):
+        self.tasks = tasks if tasks is not None else [{"command": []}]
+        self.cwd = cwd
+        self.stdout = stdout
+        self.stderr = stderr
         self.environment = {}
-        self.shell_opts = {}
+        self.shell_opts = dict(shell_opts or {})
 
     def setattr_shell_option(self, key, value):
         self.shell_opts[key] = value
 
+    def dumps(self):
+        return json.dumps(
+            {
+                "tasks": self.tasks,
+                "shell_opts": self.shell_opts,
+                "cwd": self.cwd,
+                "stdout": self.stdout,
+                "stderr": self.stderr,
+            }
+        )
+
 
 def test_pipeline_dynopro_builds_registered_subprocess_chore(tmp_path: Path):
     pipe = Pipeline(basedir=tmp_path)
@@ -173,13 +186,30 @@ def test_pipeline_dynopro_rejects_unregistered_subprocess(tmp_path: Path):
         raise AssertionError("expected unregistered subprocess to be rejected")
 
 
-def test_fluxlet_writes_dynopro_spec_in_per_resource_branch(monkeypatch, tmp_path: Path):
-    fake_jobspec = _FakeJobspec()
+def test_ensemble_runner_builds_chores_without_consuming_inputs(tmp_path: Path):
+    from matensemble.dynopro.ensemble import EnsembleDynamicsRunner
+
+    sims = ["a", "b", "c"]
+    sim_args = ["x", "y", "z"]
+    runner = EnsembleDynamicsRunner(sims, sim_args, None, nnodes=1)
 
-    class _JobspecV1:
+    chores = runner.build_dynopro_chores(tmp_path)
+
+    assert [c.id for c in chores] == [
+        "chore-dynopro-a-0000",
+        "chore-dynopro-b-0001",
+        "chore-dynopro-c-0002",
+    ]
+    assert chores[2].command[-1] == "z"
+    assert chores[0].workdir == tmp_path / "chore-dynopro-a-0000"
+    assert sims == ["a", "b", "c"] and sim_args == ["x", "y", "z"]
+
+
+def test_fluxlet_writes_dynopro_spec_in_per_resource_branch(monkeypatch, tmp_path: Path):
+    class _JobspecV1(_FakeJobspec):
         @staticmethod
         def per_resource(*_args, **_kwargs):
-            return fake_jobspec
+            return _JobspecV1()
 
     class _Future:
         pass
@@ -211,14 +241,14 @@ def test_fluxlet_writes_dynopro_spec_in_per_resource_branch(monkeypatch, tmp_pat
     )
 
     fluxlet = Fluxlet(_Handle())
-    fluxlet.submit(_Executor(), chore)
+    fut = fluxlet.submit(_Executor(), chore)
 
     with (chore.workdir / "chore.pickle").open("rb") as f:
         loaded = pickle.load(f)
 
     assert loaded.id == chore.id
-    assert fake_jobspec.cwd == str(chore.workdir)
-    assert fake_jobspec.shell_opts["mpi"] == "pmi2"
+    assert fut.jobspec.cwd == str(chore.workdir)
+    assert fut.jobspec.shell_opts["mpi"] == "pmi2"
 
 
 def test_dynopro_driver_runs_registered_callables_with_per_subprocess_args(
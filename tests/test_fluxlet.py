@@ -1,3 +1,5 @@
+import json
+import os
 from pathlib import Path
 
 from matensemble.chore import Chore
@@ -6,25 +8,35 @@ from matensemble.model import ChoreType, Resources
 
 
 class _FakeJobspec:
-    def __init__(self):
-        self.cwd = None
-        self.stdout = None
-        self.stderr = None
+    def __init__(self, tasks=None, shell_opts=None, cwd=None, stdout=None, stderr=None):
+        self.tasks = tasks if tasks is not None else [{"command": []}]
+        self.cwd = cwd
+        self.stdout = stdout
+        self.stderr = stderr
         self.environment = {}
         self.num_nodes = None
-        self.shell_opts = {}
+        self.shell_opts = dict(shell_opts or {})
 
     def setattr_shell_option(self, key, value):
         self.shell_opts[key] = value
 
+    def dumps(self):
+        return json.dumps(
+            {
+                "tasks": self.tasks,
+                "shell_opts": self.shell_opts,
+                "cwd": self.cwd,
+                "stdout": self.stdout,
+                "stderr": self.stderr,
+            }
+        )
 
-def test_fluxlet_submit_sets_workdir_and_streams(monkeypatch, tmp_path: Path):
-    fake_jobspec = _FakeJobspec()
 
-    class _JobspecV1:
+def test_fluxlet_submit_sets_workdir_and_streams(monkeypatch, tmp_path: Path):
+    class _JobspecV1(_FakeJobspec):
         @staticmethod
         def from_command(*_args, **_kwargs):
-            return fake_jobspec
+            return _JobspecV1()
 
     class _Future:
         pass
@@ -56,7 +68,12 @@ def test_fluxlet_submit_sets_workdir_and_streams(monkeypatch, tmp_path: Path):
     fluxlet = Fluxlet(_Handle())
     fut = fluxlet.submit(_Executor(), chore)
     assert fut.chore_id == "chore-fx-1"
-    assert fake_jobspec.cwd == str(chore.workdir)
+    assert fut.jobspec.cwd == str(chore.workdir)
+    assert fut.jobspec.tasks[0]["command"] == ["echo", "ok"]
+
+    fluxlet.flush_metadata()
+    metadata = json.loads((chore.workdir / "metadata.json").read_text())
+    assert metadata["id"] == "chore-fx-1"
 
 
 def test_fluxlet_handles_empty_allocation(monkeypatch):
@@ -85,3 +102,285 @@ def test_fluxlet_handles_empty_allocation(monkeypatch):
 
     fluxlet = Fluxlet(_Handle())
     assert (fluxlet.num_nodes, fluxlet.gpus_per_node) == (0, 0)
+
+
+def test_fluxlet_prepared_jobspecs_submit_as_annotated_futures(
+    monkeypatch, tmp_path: Path
+):
+    events = []
+
+    class _JobspecV1(_FakeJobspec):
+        def __init__(self, **kwargs):
+            events.append(("build", None))
+            super().__init__(**kwargs)
+
+        @staticmethod
+        def from_command(*_args, **_kwargs):
+            return _FakeJobspec()
+
+    class _Future:
+        pass
+
+    class _Executor:
+        def submit(self, jobspec):
+            events.append(("submit", jobspec.cwd))
+            return _Future()
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+
+    chores = [
+        Chore(
+            id=f"chore-bulk-{i}",
+            workdir=tmp_path / f"chore-bulk-{i}",
+            command=["echo", str(i)],
+            chore_type=ChoreType.EXECUTABLE,
+            resources=Resources(),
+        )
+        for i in range(3)
+    ]
+    fluxlet = Fluxlet(object())
+    # the manager prepares a whole batch before submitting any of it
+    jobspecs = [fluxlet.prepare(chore) for chore in chores]
+    executor = _Executor()
+    futs = [
+        fluxlet.submit_prepared(executor, chore, jobspec)
+        for chore, jobspec in zip(chores, jobspecs)
+    ]
+
+    assert [f.chore_id for f in futs] == [c.id for c in chores]
+    assert [kind for kind, _ in events] == ["build"] * 3 + ["submit"] * 3
+    assert [f.chore_obj for f in futs] == chores
+
+
+def test_fluxlet_env_snapshot_is_shared_and_never_mutated(monkeypatch, tmp_path: Path):
+    class _JobspecV1(_FakeJobspec):
+        @staticmethod
+        def from_command(*_args, **_kwargs):
+            return _JobspecV1()
+
+    class _Executor:
+        def submit(self, jobspec):
+            return type("_Future", (), {"jobspec": jobspec})()
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(object())
+
+    plain = Chore(
+        id="plain",
+        workdir=tmp_path / "plain",
+        command=["true"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    override = Chore(
+        id="override",
+        workdir=tmp_path / "override",
+        command=["true"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(env={"MATENSEMBLE_TEST_VAR": "1"}),
+    )
+
+    plain_fut = fluxlet.submit(_Executor(), plain)
+    override_fut = fluxlet.submit(_Executor(), override)
+
+    assert plain_fut.jobspec.environment is fluxlet._env_snapshot
+    assert override_fut.jobspec.environment["MATENSEMBLE_TEST_VAR"] == "1"
+    assert "MATENSEMBLE_TEST_VAR" not in fluxlet._env_snapshot
+
+
+def test_fluxlet_prepare_workdirs_skips_mkdir_on_submit(monkeypatch, tmp_path: Path):
+    class _JobspecV1(_FakeJobspec):
+        @staticmethod
+        def from_command(*_args, **_kwargs):
+            return _JobspecV1()
+
+    class _Executor:
+        def submit(self, jobspec):
+            return type("_Future", (), {"jobspec": jobspec})()
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(object())
+
+    chore = Chore(
+        id="prepared",
+        workdir=tmp_path / "nested" / "prepared",
+        command=["true"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    fluxlet.prepare_workdirs([chore])
+    assert chore.workdir.is_dir()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("workdir should already be prepared")
+
+    monkeypatch.setattr("os.makedirs", _fail)
+    fut = fluxlet.submit(_Executor(), chore)
+    assert fut.jobspec.cwd == str(chore.workdir)
+
+
+def test_fluxlet_prepare_workdirs_reuses_existing_dirs(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(object())
+
+    (tmp_path / "existing").mkdir()
+    chores = [
+        Chore(
+            id=name,
+            workdir=tmp_path / name,
+            command=["true"],
+            chore_type=ChoreType.EXECUTABLE,
+            resources=Resources(),
+        )
+        for name in ("existing", "missing")
+    ]
+
+    made = []
+    real_makedirs = os.makedirs
+
+    def _makedirs(path, *args, **kwargs):
+        made.append(str(path))
+        return real_makedirs(path, *args, **kwargs)
+
+    monkeypatch.setattr("os.makedirs", _makedirs)
+    fluxlet.prepare_workdirs(chores)
+
+    assert made == [str(tmp_path / "missing")]
+    assert {str(c.workdir) for c in chores} <= fluxlet._created_workdirs
+
+
+def test_fluxlet_reuses_jobspec_template_per_resource_shape(
+    monkeypatch, tmp_path: Path
+):
+    built = []
+
+    class _JobspecV1(_FakeJobspec):
+        @staticmethod
+        def from_command(command, *args, **_kwargs):
+            built.append(args)
+            return _JobspecV1()
+
+    class _Executor:
+        def submit(self, jobspec):
+            return type("_Future", (), {"jobspec": jobspec})()
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(object())
+
+    def _chore(name, resources):
+        return Chore(
+            id=name,
+            workdir=tmp_path / name,
+            command=["echo", name],
+            chore_type=ChoreType.EXECUTABLE,
+            resources=resources,
+        )
+
+    futs = [
+        fluxlet.submit(_Executor(), _chore("a", Resources())),
+        fluxlet.submit(_Executor(), _chore("b", Resources())),
+        fluxlet.submit(_Executor(), _chore("c", Resources(cores_per_task=2))),
+    ]
+
+    assert len(built) == 2
+    assert [f.jobspec.tasks[0]["command"] for f in futs] == [
+        ["echo", "a"],
+        ["echo", "b"],
+        ["echo", "c"],
+    ]
+    assert futs[0].jobspec is not futs[1].jobspec
+
+
+def test_fluxlet_submit_waits_on_oldest_ingest_when_fanout_is_full(
+    monkeypatch, tmp_path: Path
+):
+    waited = []
+
+    class _JobspecV1(_FakeJobspec):
+        @staticmethod
+        def from_command(*_args, **_kwargs):
+            return _JobspecV1()
+
+    class _Future:
+        def __init__(self, index):
+            self.index = index
+
+        def jobid(self):
+            waited.append(self.index)
+            return self.index
+
+    class _Executor:
+        def __init__(self):
+            self.count = 0
+
+        def submit(self, jobspec):
+            self.count += 1
+            return _Future(self.count)
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(object(), fanout=2)
+
+    chores = [
+        Chore(
+            id=f"fanout-{i}",
+            workdir=tmp_path / f"fanout-{i}",
+            command=["true"],
+            chore_type=ChoreType.EXECUTABLE,
+            resources=Resources(),
+        )
+        for i in range(4)
+    ]
+    executor = _Executor()
+    for chore in chores:
+        fluxlet.submit_prepared(executor, chore, fluxlet.prepare(chore))
+
+    assert waited == [1, 2]
+    assert len(fluxlet._ingesting) == 2
+
+
+def test_fluxlet_shared_output_paths_append_to_one_file(monkeypatch, tmp_path: Path):
+    class _JobspecV1(_FakeJobspec):
+        @staticmethod
+        def from_command(*_args, **_kwargs):
+            return _JobspecV1()
+
+    class _Executor:
+        def submit(self, jobspec):
+            return type("_Future", (), {"jobspec": jobspec})()
+
+    monkeypatch.setattr("flux.job.JobspecV1", _JobspecV1, raising=False)
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", lambda _self: (1, 0))
+    fluxlet = Fluxlet(
+        object(),
+        shared_stdout_path=tmp_path / "stdout",
+        shared_stderr_path=tmp_path / "stderr",
+    )
+
+    chore = Chore(
+        id="shared",
+        workdir=tmp_path / "shared",
+        command=["true"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    spec = fluxlet.submit(_Executor(), chore).jobspec
+
+    assert spec.stdout == str(tmp_path / "stdout")
+    assert spec.stderr == str(tmp_path / "stderr")
+    assert spec.shell_opts["output.mode"] == "append"
+    assert spec.shell_opts["output.stdout.label"] is True
+
+
+def test_fluxlet_reuses_known_allocation_without_rpcs(monkeypatch):
+    def _fail(_self):
+        raise AssertionError("allocation should not be queried again")
+
+    monkeypatch.setattr(Fluxlet, "get_gpus_per_node", _fail)
+    fluxlet = Fluxlet(object(), allocation=(4, 8))
+
+    assert (fluxlet.num_nodes, fluxlet.gpus_per_node) == (4, 8)
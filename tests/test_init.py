@@ -7,3 +7,27 @@ def test_package_exports_core_types():
     assert matensemble.OutputReference is OutputReference
     assert matensemble.Resources is Resources
     assert matensemble.ChoreType is ChoreType
+
+
+def test_pipeline_imports_without_flux():
+    import os
+    import subprocess
+    import sys
+
+    # a None entry in sys.modules makes any `import flux` raise ImportError
+    code = "import sys; sys.modules['flux'] = None; import matensemble.pipeline"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
+
+
+def test_runtime_worker_does_not_import_networkx():
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, matensemble.runtime_worker; "
+        "sys.exit('networkx' in sys.modules)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)
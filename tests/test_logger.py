@@ -1,10 +1,15 @@
 import json
 import logging
+import logging.handlers
 from datetime import datetime
 from pathlib import Path
 
 from matensemble.logger import (
     StatusWriter,
+    _LOG_DATEFMT,
+    _LOG_FORMAT,
+    _WorkflowFormatter,
+    _flush_log_listener,
     _setup_logger,
     _setup_status_writer,
     normalize_status_payload,
@@ -60,6 +65,23 @@ def test_status_history_is_append_only_and_matches_summary(tmp_path: Path):
     )
 
 
+def test_status_summary_is_complete_despite_short_writes(monkeypatch, tmp_path: Path):
+    import os
+
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, data[:16]))
+
+    writer = StatusWriter(tmp_path / "status.json", 1, 8, 0)
+    writer.update(
+        pending=0, running=1, completed=2, failed=0, free_cores=4, free_gpus=0
+    )
+
+    payload = json.loads((tmp_path / "status.json").read_text())
+    assert payload["current"]["completed"] == 2
+    history = read_status_history(tmp_path / "status.json")
+    assert history[-1]["completed"] == 2
+
+
 def test_terminal_update_records_failure_details(tmp_path: Path):
     writer = StatusWriter(tmp_path / "status.json", 1, 8, 0)
     writer.update(
@@ -155,3 +177,138 @@ def test_setup_logger_creates_log_file(monkeypatch, tmp_path: Path):
     logger = _setup_logger(tmp_path)
     assert isinstance(logger, logging.Logger)
     assert (tmp_path / "matensemble_workflow.log").exists()
+
+
+def test_setup_logger_writes_file_through_listener(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr("sys.stderr.isatty", lambda: False)
+    logger = _setup_logger(tmp_path)
+    assert any(
+        isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers
+    )
+
+    logger.debug("queued %s", "record")
+    _flush_log_listener()
+
+    text = (tmp_path / "matensemble_workflow.log").read_text()
+    assert f"Workflow initialized at {tmp_path}" in text
+    assert "| DEBUG | matensemble | queued record" in text
+    stamp = text.splitlines()[0].split(" | ", 1)[0]
+    assert datetime.strptime(stamp, "%Y-%m-%d %H:%M:%SZ")
+
+
+def test_setup_logger_buffers_file_records(monkeypatch, tmp_path: Path):
+    import matensemble.logger as logger_mod
+
+    monkeypatch.setattr("sys.stderr.isatty", lambda: False)
+    _setup_logger(tmp_path)
+
+    (handler,) = logger_mod._log_listener.handlers
+    assert isinstance(handler, logging.handlers.MemoryHandler)
+    assert handler.flushLevel == logging.WARNING
+    assert isinstance(handler.target, logging.FileHandler)
+
+
+def test_setup_logger_reuses_listener_for_same_dir(monkeypatch, tmp_path: Path):
+    import matensemble.logger as logger_mod
+
+    monkeypatch.setattr("sys.stderr.isatty", lambda: False)
+    logger = _setup_logger(tmp_path)
+    listener = logger_mod._log_listener
+
+    assert _setup_logger(tmp_path) is logger
+    assert logger_mod._log_listener is listener
+    assert len(logger.handlers) == 1
+
+    _flush_log_listener()
+    text = (tmp_path / "matensemble_workflow.log").read_text()
+    assert text.count(f"Workflow initialized at {tmp_path}") == 2
+
+    other = tmp_path / "other"
+    other.mkdir()
+    _setup_logger(other)
+    assert logger_mod._log_listener is not listener
+    assert len(logger.handlers) == 1
+
+
+def test_workflow_formatter_matches_plain_formatter():
+    import sys
+    import time
+
+    reference = logging.Formatter(_LOG_FORMAT, _LOG_DATEFMT)
+    reference.converter = time.gmtime
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        exc_info = sys.exc_info()
+
+    for msg, info in (("x=%s", None), ("x=%s\n", exc_info), ("x=%s", exc_info)):
+        expected = logging.LogRecord(
+            "matensemble", logging.ERROR, __file__, 1, msg, (3,), info
+        )
+        record = logging.makeLogRecord(dict(expected.__dict__))
+        assert _WorkflowFormatter().format(record) == reference.format(expected)
+
+
+def test_workflow_formatter_reuses_time_text_within_a_second():
+    import time
+
+    reference = logging.Formatter(_LOG_FORMAT, _LOG_DATEFMT)
+    reference.converter = time.gmtime
+    formatter = _WorkflowFormatter()
+    for created in (100.1, 100.9, 101.0, 100.5):
+        record = logging.LogRecord("matensemble", logging.INFO, __file__, 1, "m", (), None)
+        record.created = created
+        assert formatter.formatTime(record, _LOG_DATEFMT) == reference.formatTime(
+            record, _LOG_DATEFMT
+        )
+
+
+def test_update_converts_only_new_failures(tmp_path: Path):
+    writer = StatusWriter(tmp_path / "status.json", 1, 8, 0)
+    failures = [{"chore_id": "chore-a-0001", "reason": "exception"}]
+    writer.update(1, 0, 0, 1, 8, 0, failures=failures)
+    first = writer.failures[0]
+
+    failures.append({"chore_id": "chore-b-0002", "reason": "dependency_failed"})
+    writer.update(0, 0, 0, 2, 8, 0, failures=failures)
+
+    assert writer.failures[0] is first
+    assert [item["chore_id"] for item in writer.failures] == [
+        "chore-a-0001",
+        "chore-b-0002",
+    ]
+    payload = json.loads((tmp_path / "status.json").read_text())
+    assert len(payload["failures"]) == 2
+
+    writer.update(0, 0, 0, 0, 8, 0, failures=[])
+    assert writer.failures == []
+
+
+def test_update_reconverts_a_different_failures_list(tmp_path: Path):
+    writer = StatusWriter(tmp_path / "status.json", 1, 8, 0)
+    writer.update(1, 0, 0, 1, 8, 0, failures=[{"chore_id": "chore-a-0001"}])
+
+    # a new list at least as long as the last one must not be treated as an
+    # extension of it
+    replacement = [{"chore_id": "chore-b-0002"}, {"chore_id": "chore-c-0003"}]
+    writer.update(0, 0, 0, 2, 8, 0, failures=replacement)
+
+    assert [item["chore_id"] for item in writer.failures] == [
+        "chore-b-0002",
+        "chore-c-0003",
+    ]
+
+
+def test_status_files_are_created_world_readable(tmp_path: Path):
+    import os
+    import stat
+
+    writer = StatusWriter(tmp_path / "status.json", 1, 8, 0)
+    writer.history_path.unlink()
+    old_umask = os.umask(0o022)
+    try:
+        writer.update(1, 0, 0, 0, 8, 0)
+    finally:
+        os.umask(old_umask)
+    assert stat.S_IMODE(writer.history_path.stat().st_mode) == 0o644
+    assert stat.S_IMODE(writer.path.stat().st_mode) == 0o644
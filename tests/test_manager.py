@@ -20,23 +20,370 @@ def _chore(chore_id: str, deps=()):
 def test_record_failure_is_idempotent():
     manager = FluxManager.__new__(FluxManager)
     manager._failed_chores = []
+    manager._failed_ids = set()
+    manager._chores_by_id = {"a": _chore("a")}
+    manager._base_dir = Path.cwd()
+    manager._fluxlet = type(
+        "F", (), {"shared_stdout_path": None, "shared_stderr_path": None}
+    )()
     manager._record_failure("a", "x")
     manager._record_failure("a", "x")
     assert len(manager._failed_chores) == 1
     assert manager._failed_chores[0]["exception"] is None
+    assert manager._failed_chores[0]["stderr"] == "tmp/a/stderr"
 
 
 def test_fail_dependents_marks_children():
     manager = FluxManager.__new__(FluxManager)
     manager._dependents = {"a": ["b"], "b": []}
-    manager._completed_chores = []
-    manager._running_chores = set()
+    manager._completed_chores = set()
+    manager._running_chores = {}
     manager._ready = deque(["b"])
     manager._blocked = {"b"}
     manager._failed_chores = []
+    manager._failed_ids = set()
+    manager._chores_by_id = {}
     manager._logger = type("L", (), {"error": staticmethod(lambda *args, **kwargs: None)})()
     manager._has_failed = FluxManager._has_failed.__get__(manager, FluxManager)
     manager._record_failure = FluxManager._record_failure.__get__(manager, FluxManager)
     manager._fail_dependents = FluxManager._fail_dependents.__get__(manager, FluxManager)
     manager._fail_dependents("a")
     assert manager._has_failed("b")
+
+
+def test_log_progress_skips_unchanged_ticks():
+    updates = []
+    manager = FluxManager.__new__(FluxManager)
+    manager._ready = deque(["a"])
+    manager._blocked = set()
+    manager._running_chores = {}
+    manager._completed_chores = set()
+    manager._failed_chores = []
+    manager._failed_ids = set()
+    manager._free_cores = 4
+    manager._free_gpus = 0
+    manager._last_progress = None
+    manager._last_progress_time = 0.0
+    manager._status_writer = type(
+        "W", (), {"update": staticmethod(lambda **kwargs: updates.append(kwargs))}
+    )()
+    logged = []
+    manager._logger = type(
+        "L",
+        (),
+        {
+            "isEnabledFor": staticmethod(lambda level: True),
+            "info": staticmethod(lambda *args: logged.append(args)),
+        },
+    )()
+
+    manager._log_progress()
+    manager._log_progress()
+    assert len(updates) == 1
+
+    manager._free_cores = 3
+    manager._log_progress()
+    manager._log_progress(force=True)
+    assert len(updates) == 3
+    assert len(logged) == 3
+    assert logged[-1][1:] == (1, 0, 0, 0, 3, 0)
+
+
+def test_builtin_strategy_is_reused():
+    from matensemble.strategy import AdaptiveStrategy, NonAdaptiveStrategy
+
+    manager = FluxManager.__new__(FluxManager)
+    manager._strategy_cache = {}
+    adaptive = manager._builtin_strategy(True)
+    assert isinstance(adaptive, AdaptiveStrategy)
+    assert manager._builtin_strategy(True) is adaptive
+    assert isinstance(manager._builtin_strategy(False), NonAdaptiveStrategy)
+
+
+def test_collect_completed_drains_callback_queue():
+    import queue
+    from concurrent.futures import Future
+
+    manager = FluxManager.__new__(FluxManager)
+    manager._completed_futures = queue.SimpleQueue()
+    running, done, stale = Future(), Future(), Future()
+    for chore_id, future in zip(("running", "done", "stale"), (running, done, stale)):
+        future.chore_id = chore_id
+        future.add_done_callback(manager._completed_futures.put)
+    manager._running_chores = {"running": running, "done": done}
+    done.set_result(0)
+    stale.set_result(0)
+
+    assert manager._collect_completed(timeout=0.0) == {done}
+    assert manager._running_chores == {"running": running}
+    assert manager._collect_completed(timeout=0.01) == set()
+
+
+def _submit_manager(chore_ids, max_in_flight=None, fail=()):
+    import queue
+    from concurrent.futures import Future
+
+    manager = FluxManager.__new__(FluxManager)
+    manager._chores_by_id = {c: _chore(c) for c in chore_ids}
+    manager._ready = deque(chore_ids)
+    manager._blocked = set()
+    manager._running_chores = {}
+    manager._completed_futures = queue.SimpleQueue()
+    manager._failed_chores = []
+    manager._failed_ids = set()
+    manager._dependents = {c: [] for c in chore_ids}
+    manager._max_in_flight = max_in_flight
+    manager._peak_in_flight = 0
+    manager._free_cores = 8
+    manager._free_gpus = 0
+    manager._resources_checked_at = 0.0
+    manager._executor = None
+    manager._set_cpu_affinity = True
+    manager._set_gpu_affinity = False
+    manager._logger = type(
+        "L", (), {"exception": staticmethod(lambda *args, **kwargs: None)}
+    )()
+
+    def prepare(chore, **kwargs):
+        if chore.id in fail:
+            raise RuntimeError("rejected")
+        return {"chore": chore.id}
+
+    def submit_prepared(executor, chore, jobspec):
+        assert jobspec == {"chore": chore.id}
+        fut = Future()
+        fut.chore_id = chore.id
+        fut.chore_obj = chore
+        return fut
+
+    manager._fluxlet = type(
+        "F",
+        (),
+        {
+            "prepare": staticmethod(prepare),
+            "submit_prepared": staticmethod(submit_prepared),
+            "shared_stdout_path": None,
+            "shared_stderr_path": None,
+        },
+    )()
+    manager._base_dir = Path.cwd()
+    return manager
+
+
+def test_submit_until_ooresources_respects_max_in_flight():
+    manager = _submit_manager(["a", "b", "c"], max_in_flight=2)
+
+    assert manager._submit_until_ooresources()
+    assert manager._running_chores.keys() == {"a", "b"}
+    assert list(manager._ready) == ["c"]
+
+
+def test_submit_until_ooresources_batches_unpaced_submissions():
+    manager = _submit_manager(["a", "b", "c"], fail={"b"})
+
+    assert manager._submit_until_ooresources()
+    assert manager._running_chores.keys() == {"a", "c"}
+    assert all(
+        fut.chore_id == chore_id for chore_id, fut in manager._running_chores.items()
+    )
+    assert manager._peak_in_flight == 2
+    assert manager._failed_chores[0]["chore_id"] == "b"
+    # the resources claimed for the rejected chore are handed back
+    assert manager._free_cores == 6
+    assert not manager._ready
+
+
+def test_submit_until_ooresources_reconciles_only_after_completions():
+    manager = _submit_manager(["a"])
+    checks = []
+
+    def check_resources():
+        checks.append(manager._free_cores)
+        manager._resources_checked_at = 1.0
+
+    manager._check_resources = check_resources
+    manager._ready = deque()
+    manager._resources_checked_at = None
+    assert not manager._submit_until_ooresources()
+    assert checks == []
+
+    manager._ready = deque(["a"])
+    assert manager._submit_until_ooresources()
+    assert checks == [8]
+
+
+def test_check_resources_reuses_recent_counts(monkeypatch):
+    import queue
+    from concurrent.futures import Future
+
+    import flux.resource
+
+    calls = []
+    real_resource_list = flux.resource.list.resource_list
+
+    def counting_resource_list(handle):
+        calls.append(handle)
+        return real_resource_list(handle)
+
+    monkeypatch.setattr(flux.resource.list, "resource_list", counting_resource_list)
+
+    manager = FluxManager.__new__(FluxManager)
+    manager._flux_handle = object()
+    manager._resources_checked_at = None
+    manager._check_resources(max_age=60.0)
+    manager._free_cores -= 1  # a local submission
+    manager._check_resources(max_age=60.0)
+    assert len(calls) == 1
+    assert manager._free_cores == 0
+
+    # a completion invalidates the cached counts
+    done = Future()
+    done.chore_id = "done"
+    manager._running_chores = {"done": done}
+    manager._completed_futures = queue.SimpleQueue()
+    done.add_done_callback(manager._completed_futures.put)
+    done.set_result(0)
+    manager._collect_completed(timeout=0.0)
+    manager._check_resources(max_age=60.0)
+    assert len(calls) == 2
+
+    manager._check_resources()
+    assert len(calls) == 3
+
+
+def test_manager_connects_to_given_flux_uri(monkeypatch, tmp_path: Path):
+    import flux
+
+    uris = []
+    real_flux = flux.Flux
+
+    def recording_flux(*args):
+        uris.append(args)
+        return real_flux(*args)
+
+    monkeypatch.setattr(flux, "Flux", recording_flux)
+    monkeypatch.setattr("matensemble.manager._flux_handle_cache", {})
+    manager = FluxManager(
+        chore_list=[_chore("a")],
+        base_dir=tmp_path,
+        flux_uri="local:///tmp/child/local-0",
+    )
+    assert uris == [("local:///tmp/child/local-0",)]
+    assert manager._flux_uri == "local:///tmp/child/local-0"
+
+
+def test_manager_forwards_submit_fanout(tmp_path: Path):
+    import pytest
+
+    manager = FluxManager(
+        chore_list=[_chore("a")], base_dir=tmp_path, submit_fanout=8
+    )
+    assert manager._fluxlet.fanout == 8
+
+    with pytest.raises(ValueError):
+        FluxManager(chore_list=[_chore("a")], base_dir=tmp_path, submit_fanout=0)
+
+
+def test_flux_handle_is_reused_within_a_thread(monkeypatch):
+    import os
+    import threading
+
+    import matensemble.manager as manager_module
+
+    cache = {}
+    monkeypatch.setattr(manager_module, "_flux_handle_cache", cache)
+    handle = manager_module._get_flux_handle()
+    assert manager_module._get_flux_handle() is handle
+    assert manager_module._get_flux_handle("local:///tmp/a") is not handle
+
+    # handles are not thread-safe, so another thread connects on its own
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(manager_module._get_flux_handle())
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not handle
+
+    # a handle cached under another pid, e.g. by the parent of a forked
+    # process, is never handed out
+    cache = {(-1, threading.get_ident(), None): handle}
+    monkeypatch.setattr(manager_module, "_flux_handle_cache", cache)
+    assert manager_module._get_flux_handle() is not handle
+    assert (os.getpid(), threading.get_ident(), None) in cache
+
+
+def test_pin_manager_thread_applies_affinity_in_calling_thread():
+    import os
+    import threading
+
+    import pytest
+
+    if not hasattr(os, "sched_getaffinity"):
+        pytest.skip("CPU affinity is not supported on this platform")
+
+    cpu = min(os.sched_getaffinity(0))
+    manager = FluxManager.__new__(FluxManager)
+    manager._manager_cpus = {cpu}
+    seen = []
+
+    def pin():
+        manager._pin_manager_thread()
+        seen.append(os.sched_getaffinity(0))
+
+    thread = threading.Thread(target=pin)
+    thread.start()
+    thread.join()
+    assert seen == [{cpu}]
+
+
+def test_manager_cpu_affinity_restores_calling_thread():
+    import os
+    import threading
+
+    import pytest
+
+    if not hasattr(os, "sched_getaffinity"):
+        pytest.skip("CPU affinity is not supported on this platform")
+
+    manager = FluxManager.__new__(FluxManager)
+    seen = []
+
+    def run():
+        original = os.sched_getaffinity(0)
+        manager._manager_cpus = {min(original)}
+        with manager._manager_cpu_affinity():
+            seen.append(os.sched_getaffinity(0))
+        seen.append(os.sched_getaffinity(0) == original)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    assert seen == [manager._manager_cpus, True]
+
+
+def test_log_worker_runs_until_the_run_finishes(monkeypatch):
+    import threading
+    import time
+
+    import matensemble.manager as manager_module
+
+    monkeypatch.setattr(manager_module, "_flush_log_buffer", lambda: None)
+    manager = FluxManager.__new__(FluxManager)
+    # every queue is empty, as it is while a batch is being submitted
+    manager._ready = deque()
+    manager._running_chores = {}
+    manager._blocked = set()
+    ticks = []
+    manager._log_progress = lambda: ticks.append(None)
+
+    finished = threading.Event()
+    thread = threading.Thread(target=manager._log_worker, args=(0.001, finished))
+    thread.start()
+    time.sleep(0.05)
+    assert thread.is_alive()
+
+    finished.set()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert len(ticks) > 1
@@ -26,8 +26,9 @@ def _bare_manager():
     manager._remaining_deps = {}
     manager._ready = deque()
     manager._blocked = set()
-    manager._completed_chores = []
+    manager._completed_chores = set()
     manager._failed_chores = []
+    manager._failed_ids = set()
     manager._nnodes_on_allocation = 1
     manager._cores_per_node = 1
     manager._gpus_per_node = 0
@@ -52,7 +53,7 @@ def test_add_chore_with_completed_dependency_becomes_ready():
     manager._chores_by_id = {"dep-1": _chore("dep-1")}
     manager._dependents = {"dep-1": []}
     manager._remaining_deps = {"dep-1": 0}
-    manager._completed_chores = ["dep-1"]
+    manager._completed_chores = {"dep-1"}
 
     chore = _chore("chore-b", deps=("dep-1",))
     manager._add_chore(chore)
@@ -82,6 +83,17 @@ def test_equal_nice_preserves_ready_admission_order():
     assert list(manager._ready) == ["first", "second", "third"]
 
 
+def test_add_chore_inserts_after_equal_nice_chores():
+    manager = _bare_manager()
+
+    manager._add_chore(_chore("normal-1", nice=0))
+    manager._add_chore(_chore("background", nice=10))
+    manager._add_chore(_chore("normal-2", nice=0))
+    manager._add_chore(_chore("urgent", nice=-10))
+
+    assert list(manager._ready) == ["urgent", "normal-1", "normal-2", "background"]
+
+
 def test_dependency_unblocked_chore_sorts_into_ready_queue():
     manager = _bare_manager()
     manager._chores_by_id = {
@@ -149,3 +149,51 @@ def test_results_waits_for_finished_flag(tmp_path: Path):
     out = pipeline.results(timeout=1.0)
     timer.join()
     assert "missing" in out
+
+
+def test_pipeline_makes_relative_basedir_absolute_once(monkeypatch, tmp_path: Path):
+    monkeypatch.chdir(tmp_path)
+    pipe = Pipeline(basedir="campaigns")
+
+    assert pipe._base_dir.is_absolute()
+    assert pipe._base_dir.parent == tmp_path / "campaigns"
+    assert pipe._merge_pythonpath(None)["PYTHONPATH"] == str(
+        (tmp_path / "campaigns").resolve()
+    )
+
+
+def test_enqueue_registered_leaves_registry_resources_untouched(tmp_path: Path):
+    registry = ChoreRegistry()
+
+    @registry.chore(name="evaluate", env={"OMP_NUM_THREADS": "1"})
+    def evaluate(candidate):
+        return candidate
+
+    pipeline = Pipeline(basedir=str(tmp_path), registry=registry)
+    pipeline.call("evaluate", "candidate")
+    chore = pipeline._chore_list[0]
+    entry = registry.get("evaluate")
+
+    assert chore.resources is not entry.resources
+    assert chore.resources.env["OMP_NUM_THREADS"] == "1"
+    assert "PYTHONPATH" in chore.resources.env
+    assert entry.resources.env == {"OMP_NUM_THREADS": "1"}
+
+
+def test_results_returns_when_submission_future_completes(tmp_path: Path):
+    pipeline = Pipeline(basedir=str(tmp_path))
+    pipeline._output_reference_list = []
+    submission = Future()
+
+    def finish():
+        pipeline._finished = True
+        submission.set_result({})
+
+    pipeline._finished = False
+    pipeline._submission_future = submission
+    timer = threading.Timer(0.01, finish)
+    timer.start()
+    start = time.monotonic()
+    assert pipeline.results(timeout=5.0) == {}
+    timer.join()
+    assert time.monotonic() - start < 0.09
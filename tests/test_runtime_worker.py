@@ -65,3 +65,4 @@ def test_main_executes_chore_and_writes_result(monkeypatch, tmp_path: Path):
 
     with (chore_dir / "result.pickle").open("rb") as fh:
         assert pickle.load(fh) == 42
+    assert not (chore_dir / "result.pickle.tmp").exists()
@@ -1,8 +1,10 @@
 import pickle
 
+import pytest
+
 from pathlib import Path
 
-from matensemble.runtime_worker import _load_dep_result
+from matensemble.runtime_worker import _load_dep_result, _load_pickle
 
 
 def test_load_dep_result_reads_result_pickle(tmp_path: Path):
@@ -20,3 +22,63 @@ def test_load_dep_result_reads_result_pickle(tmp_path: Path):
 
     loaded = _load_dep_result(spec_file, dep_id)
     assert loaded == expected
+
+
+def test_load_pickle_rejects_empty_file(tmp_path: Path):
+    empty = tmp_path / "result.pickle"
+    empty.touch()
+    with pytest.raises(EOFError):
+        _load_pickle(empty)
+
+
+def _write_worker_inputs(tmp_path: Path, func) -> Path:
+    import cloudpickle
+
+    from matensemble.chore import Chore
+    from matensemble.model import ChoreType, Resources
+
+    workdir = tmp_path / "workflow" / "out" / "chore-work-0001"
+    workdir.mkdir(parents=True)
+    registry = workdir.parent / "registry"
+    registry.mkdir()
+    (registry / "work").write_bytes(cloudpickle.dumps(func))
+    chore = Chore(
+        id="chore-work-0001",
+        workdir=workdir,
+        command=["python"],
+        chore_type=ChoreType.PYTHON,
+        resources=Resources(),
+        chore_qualname="work",
+    )
+    spec_file = workdir / "chore.pickle"
+    spec_file.write_bytes(pickle.dumps(chore))
+    return spec_file
+
+
+@pytest.mark.parametrize("picklable", [True, False])
+def test_main_writes_result_without_leaving_temp_files(
+    monkeypatch, tmp_path: Path, picklable: bool
+):
+    import threading
+
+    from matensemble import runtime_worker
+
+    func = (lambda: {"x": 1}) if picklable else threading.Lock
+    spec_file = _write_worker_inputs(tmp_path, func)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["worker", "--chore-id", "chore-work-0001", "--spec-file", str(spec_file)],
+    )
+
+    if picklable:
+        runtime_worker.main()
+        result = pickle.loads((spec_file.parent / "result.pickle").read_bytes())
+        assert result == {"x": 1}
+    else:
+        with pytest.raises(TypeError):
+            runtime_worker.main()
+        assert not (spec_file.parent / "result.pickle").exists()
+    assert sorted(p.name for p in spec_file.parent.iterdir()) == [
+        "chore.pickle",
+        *(["result.pickle"] if picklable else []),
+    ]
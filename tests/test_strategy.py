@@ -1,3 +1,7 @@
+import queue
+import threading
+import time
+
 from concurrent.futures import Future
 from collections import deque
 from pathlib import Path
@@ -43,16 +47,21 @@ def _completed_future(chore: Chore) -> Future:
 
 def _strategy_manager(chores: list[Chore]) -> FluxManager:
     manager = FluxManager.__new__(FluxManager)
-    manager._futures = {_completed_future(chore) for chore in chores}
-    manager._running_chores = {chore.id for chore in chores}
-    manager._completed_chores = []
+    manager._chores_by_id = {chore.id: chore for chore in chores}
+    manager._running_chores = {chore.id: _completed_future(chore) for chore in chores}
+    manager._completed_futures = queue.SimpleQueue()
+    for future in manager._running_chores.values():
+        future.add_done_callback(manager._completed_futures.put)
+    manager._completed_chores = set()
     manager._dependents = {chore.id: [] for chore in chores}
     manager._remaining_deps = {}
     manager._blocked = set()
     manager._failed_chores = []
+    manager._failed_ids = set()
     manager._write_restart_freq = None
     manager._free_cores = 0
     manager._free_gpus = 0
+    manager._dynopro = False
     manager._nnodes_on_allocation = 1
     manager._cores_per_node = len(chores)
     manager._gpus_per_node = 0
@@ -71,18 +80,20 @@ def test_adaptive_strategy_refreshes_capacity_before_backfill(tmp_path: Path):
         resources=Resources(),
     )
     manager = _strategy_manager([chore])
-    free_cores_seen_by_submit = []
+    manager._resources_checked_at = 0.0
+    cache_seen_by_submit = []
     manager._submit_until_ooresources = lambda **_kwargs: (
-        free_cores_seen_by_submit.append(manager._free_cores)
+        cache_seen_by_submit.append(manager._resources_checked_at)
     )
 
     AdaptiveStrategy(manager).process_futures(buffer_time=0.0)
 
-    assert free_cores_seen_by_submit == [1]
-    assert manager._completed_chores == [chore.id]
+    # the completion invalidated the cached counts, so the backfill reconciles
+    assert cache_seen_by_submit == [None]
+    assert manager._completed_chores == {chore.id}
 
 
-def test_nonadaptive_strategy_waits_for_entire_wave(monkeypatch, tmp_path: Path):
+def test_nonadaptive_strategy_waits_for_entire_wave(tmp_path: Path):
     chores = [
         Chore(
             id=f"wave-worker-{index}",
@@ -94,21 +105,97 @@ def test_nonadaptive_strategy_waits_for_entire_wave(monkeypatch, tmp_path: Path)
         for index in range(3)
     ]
     manager = _strategy_manager(chores)
-    waited_on = None
-
-    def wait_for_wave(futures, **kwargs):
-        nonlocal waited_on
-        waited_on = set(futures)
-        assert kwargs == {}
-        return set(futures), set()
-
-    monkeypatch.setattr("matensemble.strategy.concurrent.futures.wait", wait_for_wave)
-
+    pending = Future()
+    pending.chore_id = "wave-worker-late"
+    pending.chore_obj = chores[0]
+    pending.add_done_callback(manager._completed_futures.put)
+    manager._running_chores[pending.chore_id] = pending
+    manager._dependents[pending.chore_id] = []
+
+    timer = threading.Timer(0.05, pending.set_result, args=(0,))
+    timer.start()
     NonAdaptiveStrategy(manager).process_futures(buffer_time=0.001)
+    timer.join()
 
-    assert waited_on is not None
-    assert len(waited_on) == 3
-    assert manager._futures == set()
-    assert set(manager._completed_chores) == {chore.id for chore in chores}
+    assert manager._running_chores == {}
+    assert manager._completed_chores == {chore.id for chore in chores} | {
+        "wave-worker-late"
+    }
     # Capacity is refreshed by the manager at the beginning of the next wave.
     assert manager._free_cores == 0
+
+
+def test_adaptive_strategy_returns_on_first_completion(tmp_path: Path):
+    chore = Chore(
+        id="adaptive-first",
+        workdir=tmp_path / "adaptive-first",
+        command=["echo", "ok"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    manager = _strategy_manager([chore])
+    manager._submit_until_ooresources = lambda **_kwargs: None
+    still_running = Future()
+    still_running.chore_id = "adaptive-still-running"
+    manager._running_chores[still_running.chore_id] = still_running
+
+    start = time.monotonic()
+    AdaptiveStrategy(manager).process_futures(buffer_time=5.0)
+
+    assert time.monotonic() - start < 1.0
+    assert manager._completed_chores == {chore.id}
+    assert manager._running_chores == {still_running.chore_id: still_running}
+
+
+def test_adaptive_strategy_backfills_with_run_dynopro_flag(tmp_path: Path):
+    chore = Chore(
+        id="adaptive-dynopro",
+        workdir=tmp_path / "adaptive-dynopro",
+        command=["echo", "ok"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    manager = _strategy_manager([chore])
+    manager._dynopro = True
+    seen = []
+    manager._submit_until_ooresources = lambda **kwargs: seen.append(kwargs)
+
+    AdaptiveStrategy(manager).process_futures(buffer_time=0.0)
+
+    assert seen == [{"dynopro": True}]
+
+
+def test_nonzero_exit_is_reported_in_shared_output_files(caplog, tmp_path: Path):
+    import logging
+    from types import SimpleNamespace
+
+    chore = Chore(
+        id="shared-worker",
+        workdir=tmp_path / "out" / "shared-worker",
+        command=["false"],
+        chore_type=ChoreType.EXECUTABLE,
+        resources=Resources(),
+    )
+    manager = _strategy_manager([chore])
+    failed = Future()
+    failed.chore_id = chore.id
+    failed.chore_obj = chore
+    failed.set_result(1)
+    manager._logger = logging.getLogger("test-strategy")
+    manager._base_dir = tmp_path
+    manager._fluxlet = SimpleNamespace(
+        shared_stdout_path=str(tmp_path / "stdout"),
+        shared_stderr_path=str(tmp_path / "stderr"),
+    )
+
+    with caplog.at_level(logging.ERROR, logger="test-strategy"):
+        assert not NonAdaptiveStrategy(manager)._handle_completed(failed)
+
+    (message,) = [r.getMessage() for r in caplog.records]
+    assert f"stdout={tmp_path / 'stdout'}" in message
+    assert f"stderr={tmp_path / 'stderr'}" in message
+    assert manager._failed_ids == {chore.id}
+    # the failure note lands in the shared stderr, not a new per-chore file
+    assert "NONZERO EXIT" in (tmp_path / "stderr").read_text()
+    assert not chore.workdir.exists()
+    assert manager._failed_chores[0]["stderr"] == "stderr"
@@ -4,7 +4,7 @@ from pathlib import Path
 from starlette.testclient import TestClient
 
 from matensemble.logger import StatusWriter
-from matensemble.model import OutputReference
+from matensemble.model import ChoreType, OutputReference
 from matensemble.utils import (
     _collect_dep_ids,
     _json_safe,
@@ -40,6 +40,11 @@ def test_json_safe_handles_paths_and_output_refs(tmp_path: Path):
     assert out["ref"]["chore_id"] == "abc"
 
 
+def test_json_safe_keeps_enum_names_for_str_enums():
+    out = _json_safe([ChoreType.PYTHON, frozenset({1}), (None, 1.5, True)])
+    assert out == ["PYTHON", [1], [None, 1.5, True]]
+
+
 def test_dashboard_api_serves_v2_status_and_history(tmp_path: Path):
     status_path = tmp_path / "status.json"
     writer = StatusWriter(status_path, 2, 8, 1)